@@ -1,23 +1,29 @@
 """The Ensto BLE integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
+from functools import partial
 import voluptuous as vol
 
-from homeassistant.config_entries import ConfigEntry
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant, ServiceCall
-from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import config_validation as cv
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.util import dt as dt_util
 
 from .const import (
     DOMAIN,
+    CONF_CURRENCY,
+    DATA_LOADED_ENTRIES,
+    DATA_MANAGER_CACHE,
+    DEFAULT_CURRENCY,
+    ONE_MINUTE,
 )
 
-from .config_flow import CONF_CURRENCY, DEFAULT_CURRENCY
 from .ensto_thermostat_manager import EnstoThermostatManager
 from .storage_manager import EnstoStorageManager
 
@@ -27,30 +33,39 @@ _LOGGER = logging.getLogger(__name__)
 type EnstoConfigEntry = ConfigEntry[EnstoThermostatManager]
 
 # List of supported platforms for this integration
-PLATFORMS = [Platform.SENSOR, Platform.SWITCH, Platform.SELECT, Platform.NUMBER, Platform.DATETIME]
+PLATFORMS = (Platform.SENSOR, Platform.SWITCH, Platform.SELECT, Platform.NUMBER, Platform.DATETIME)
 
 # Set services
 SERVICE_SET_TIME = "set_device_time"
 SERVICE_GET_CALENDAR_DAY = "get_calendar_day"
 SERVICE_SET_CALENDAR_DAY = "set_calendar_day"
 
+# Cached standard time offset as (timezone, year, offset minutes)
+_STANDARD_OFFSET_CACHE = None
+
+# Range validators are stateless, so a single instance serves every field
+_DAY = vol.Range(min=1, max=7)
+_HOUR = vol.Range(min=0, max=23)
+_MINUTE = vol.Range(min=0, max=59)
+
 GET_DAY_SCHEMA = vol.Schema({
-    vol.Required("day"): vol.Range(min=1, max=7)
+    vol.Required("day"): _DAY
 }, extra=vol.ALLOW_EXTRA)
 
+# Schema of a single calendar program, shared by every program in a day
+_PROGRAM_SCHEMA = vol.Schema({
+    vol.Required("start_hour"): _HOUR,
+    vol.Required("start_minute"): _MINUTE,
+    vol.Required("end_hour"): _HOUR,
+    vol.Required("end_minute"): _MINUTE,
+    vol.Required("temp_offset"): vol.Range(min=-20, max=20),
+    vol.Required("power_offset"): vol.Range(min=-100, max=100),
+    vol.Required("enabled"): bool
+})
+
 SET_DAY_SCHEMA = vol.Schema({
-    vol.Required("day"): vol.Range(min=1, max=7),
-    vol.Required("programs"): vol.All(vol.Length(max=6), [
-        vol.Schema({
-            vol.Required("start_hour"): vol.Range(min=0, max=23),
-            vol.Required("start_minute"): vol.Range(min=0, max=59),
-            vol.Required("end_hour"): vol.Range(min=0, max=23),
-            vol.Required("end_minute"): vol.Range(min=0, max=59),
-            vol.Required("temp_offset"): vol.Range(min=-20, max=20),
-            vol.Required("power_offset"): vol.Range(min=-100, max=100),
-            vol.Required("enabled"): bool
-        })
-    ])
+    vol.Required("day"): _DAY,
+    vol.Required("programs"): vol.All(vol.Length(max=6), [_PROGRAM_SCHEMA])
 }, extra=vol.ALLOW_EXTRA)
 
 async def async_setup_entry(hass: HomeAssistant, entry: EnstoConfigEntry) -> bool:
@@ -63,210 +78,57 @@ async def async_setup_entry(hass: HomeAssistant, entry: EnstoConfigEntry) -> boo
         )
         _LOGGER.debug("Migrated config entry %s to have unique_id", entry.data["mac_address"])
 
+    # Initialize the thermostat manager
+    manager = EnstoThermostatManager(hass, entry.data["mac_address"])
+
+    # Setup scanner and verify connection, retrying flaky links before giving up.
+    # Only an unreachable device is worth a retry by Home Assistant; anything
+    # failing after this point is a real error and keeps its traceback.
+    manager.setup()
+    try:
+        await manager.connect_with_backoff()
+    except Exception as ex:
+        _LOGGER.error("Error setting up Ensto BLE: %s", str(ex))
+        raise ConfigEntryNotReady from ex
+
+    # Anything failing from here on must not leave the BLE connection open,
+    # since Home Assistant only unloads entries that finished setting up
+    services_counted = False
     try:
-        # Initialize the thermostat manager
-        manager = EnstoThermostatManager(hass, entry.data["mac_address"])
-        
-        # Setup scanner and verify connection
-        manager.setup()
-        await manager.ensure_connection()
-        
         # Store the manager instance in runtime_data
         entry.runtime_data = manager
 
-        # Read device information
-        manager.sw_version = await manager.read_software_revision()
-        manager.hw_version = await manager.read_hardware_revision()
-
-        # Update config entry title with current info
-        title = f"{manager.model_number or 'Unknown Model'} {manager.device_name or entry.data['mac_address']}"
-        hass.config_entries.async_update_entry(entry, title=title)
-
-        # Initialize device currency from config flow
-        try:
-            config_currency = entry.data.get(CONF_CURRENCY, DEFAULT_CURRENCY)
-            success = await manager.write_energy_unit(config_currency, 0.0)
-            
-            if not success:
-                _LOGGER.warning("Failed to set device currency")
-                
-        except Exception as e:
-            _LOGGER.warning("Failed to initialize device currency: %s", e)
-
-        async def set_device_time(call: ServiceCall) -> None:
-            """Set device time to match Home Assistant time."""
-
-            # Get current UTC time from Home Assistant
-            utc_now = dt_util.utcnow()
-            
-            # Extract the target entity from service call data
-            target_entity = call.data.get("entity_id")
-                
-            if not target_entity:
-                _LOGGER.error("No target entity specified")
-                return
-
-            # Handle both single entity and multiple entities if given by user
-            if isinstance(target_entity, list):
-                entity_ids = target_entity
-            else:
-                entity_ids = [target_entity]
-
-            # Debug timezone info once (applies to all devices)
-            _LOGGER.debug("Action [Set Device Time]: setting UTC time %s", utc_now.strftime('%Y-%m-%d %H:%M:%S'))
-
-            # Process each entity
-            for entity_id in entity_ids:
-                # Get the entity registry entry for the target
-                entity_registry = er.async_get(hass)
-                entity_entry = entity_registry.async_get(entity_id)
-                
-                # Get config entry id from entity entry
-                config_entry_id = entity_entry.config_entry_id
-                
-                # Get the correct thermostat manager instance for this device
-                config_entry = hass.config_entries.async_get_entry(config_entry_id)
-                manager = config_entry.runtime_data
-                
-                # Read current DST settings from the device
-                current_dst_settings = await manager.read_daylight_saving()
-                dst_enabled = current_dst_settings.get('enabled', False) if current_dst_settings else False
-
-                # Calculate timezone offset based on DST setting (same logic as DST switch)
-                ha_tz = dt_util.DEFAULT_TIME_ZONE
-                
-                if dst_enabled:
-                    # DST enabled: use base timezone offset (standard time)
-                    january_utc = utc_now.replace(month=1, day=15)
-                    january_local = january_utc.astimezone(ha_tz)
-                    tz_offset = int(january_local.utcoffset().total_seconds() / 60)
-
-                    _LOGGER.debug("Action [Set Device Time] for [%s]: DST enabled, using base offset %d min", 
-                                manager.mac_address, tz_offset)
-                else:
-                    # DST disabled: use current offset (includes DST if active)
-                    local_now = utc_now.astimezone(ha_tz)
-                    tz_offset = int(local_now.utcoffset().total_seconds() / 60)
-                    _LOGGER.debug("Action [Set Device Time] for [%s]: DST disabled, using current offset %d min", 
-                                manager.mac_address, tz_offset)
-
-                # Write UTC time to the device
-                if await manager.write_date_and_time(
-                    utc_now.year,
-                    utc_now.month,
-                    utc_now.day,
-                    utc_now.hour,
-                    utc_now.minute,
-                    utc_now.second
-                ):
-                    # Update timezone and DST settings while preserving DST state
-                    await manager.write_daylight_saving(
-                        enabled=dst_enabled,
-                        winter_to_summer=60,
-                        summer_to_winter=60,
-                        timezone_offset=tz_offset
-                    )
-                    
-                    _LOGGER.debug("Action [Set Device Time] for [%s]: successfully set time with DST=%s, offset=%d min",
-                                manager.mac_address, dst_enabled, tz_offset)
-
-                    # Notify only datetime sensor to update
-                    async_dispatcher_send(hass, f"ensto_datetime_update_{manager.mac_address}")
-                else:
-                    _LOGGER.error("Action [Set Device Time] for [%s]: failed to set time", manager.mac_address)
-
-        async def get_calendar_day(call: ServiceCall) -> None:
-                    """Get calendar day programs service."""
-                    # Get device_id from target
-                    device_ids = call.data.get("target", [])
-                    if not device_ids:
-                        _LOGGER.error("Action [Get Calendar Day]: no target device specified")
-                        return
-
-                    if not isinstance(device_ids, list):
-                        device_ids = [device_ids]
-
-                    day = call.data["day"]
-                    device_registry = dr.async_get(hass)
-
-                    for device_id in device_ids:
-                        # Find config entry for this device
-                        device_entry = device_registry.async_get(device_id)
-
-                        if not device_entry:
-                            _LOGGER.error("Action [Get Calendar Day %d]: device not found %s", day, device_id)
-                            continue
-
-                        # Get config entry from device
-                        config_entry_id = next(iter(device_entry.config_entries))
-                        config_entry = hass.config_entries.async_get_entry(config_entry_id)
-                        manager = config_entry.runtime_data
-
-                        # Read calendar day
-                        result = await manager.read_calendar_day(day)
-
-                        if result:
-                            enabled_programs = [p for p in result['programs'] if p['enabled']]
-                            programs_str = ", ".join([f"{p['start_hour']:02d}:{p['start_minute']:02d}-{p['end_hour']:02d}:{p['end_minute']:02d} {p['temp_offset']:+.1f}°C" for p in enabled_programs])
-                            _LOGGER.info("Action [Get Calendar Day %d] for [%s] (%s): %d programs [%s]",
-                                    day, manager.device_name or "Unknown", manager.mac_address, len(enabled_programs), programs_str)
-                        else:
-                            _LOGGER.error("Action [Get Calendar Day %d] for [%s] (%s): failed to read", 
-                                    day, manager.device_name or "Unknown", manager.mac_address)
-
-        async def set_calendar_day(call: ServiceCall) -> None:
-                    """Set calendar day programs service."""
-                    # Get device_id from target
-                    device_ids = call.data.get("target", [])
-                    if not device_ids:
-                        _LOGGER.error("Action [Set Calendar Day]: no target device specified")
-                        return
-
-                    if not isinstance(device_ids, list):
-                        device_ids = [device_ids]
-
-                    day = call.data["day"]
-                    programs = call.data["programs"]
-                    device_registry = dr.async_get(hass)
-
-                    for device_id in device_ids:
-                        # Find config entry for this device
-                        device_entry = device_registry.async_get(device_id)
-
-                        if not device_entry:
-                            _LOGGER.error("Action [Set Calendar Day %d]: device not found %s", day, device_id)
-                            continue
-
-                        # Get config entry from device
-                        config_entry_id = next(iter(device_entry.config_entries))
-                        config_entry = hass.config_entries.async_get_entry(config_entry_id)
-                        manager = config_entry.runtime_data
-
-                        # Write calendar day
-                        success = await manager.write_calendar_day(day, programs)
-
-                        if success:
-                            enabled_programs = [p for p in programs if p['enabled']]
-                            programs_str = ", ".join([f"{p['start_hour']:02d}:{p['start_minute']:02d}-{p['end_hour']:02d}:{p['end_minute']:02d} {p['temp_offset']:+.1f}°C" for p in enabled_programs])
-                            _LOGGER.info("Action [Set Calendar Day %d] for [%s] (%s): %d programs saved [%s]",
-                                    day, manager.device_name or "Unknown", manager.mac_address, len(enabled_programs), programs_str)
-                        else:
-                            _LOGGER.error("Action [Set Calendar Day %d] for [%s] (%s): failed to write", 
-                                    day, manager.device_name or "Unknown", manager.mac_address)
+        # Shared data for service handlers
+        domain_data = hass.data.get(DOMAIN)
+        if domain_data is None:
+            domain_data = hass.data[DOMAIN] = {}
+        if DATA_MANAGER_CACHE not in domain_data:
+            domain_data[DATA_MANAGER_CACHE] = {}
+
+        # Update config entry title with current info. It only depends on the
+        # model number and name read during connect, so don't wait for the
+        # revision reads below.
+        hass.config_entries.async_update_entry(entry, title=manager.title)
+
+        # Read device information, both revisions concurrently
+        manager.sw_version, manager.hw_version = await asyncio.gather(
+            manager.read_software_revision(),
+            manager.read_hardware_revision(),
+        )
 
         # Only register services if they don't already exist
         if not hass.services.has_service(DOMAIN, SERVICE_SET_TIME):
             hass.services.async_register(
                 DOMAIN,
                 SERVICE_SET_TIME,
-                set_device_time,
+                partial(_async_service_set_device_time, hass),
             )
 
         if not hass.services.has_service(DOMAIN, SERVICE_GET_CALENDAR_DAY):
             hass.services.async_register(
                 DOMAIN,
                 SERVICE_GET_CALENDAR_DAY,
-                get_calendar_day,
+                partial(_async_service_get_calendar_day, hass),
                 schema=GET_DAY_SCHEMA,
             )
 
@@ -274,18 +136,270 @@ async def async_setup_entry(hass: HomeAssistant, entry: EnstoConfigEntry) -> boo
             hass.services.async_register(
                 DOMAIN,
                 SERVICE_SET_CALENDAR_DAY,
-                set_calendar_day,
+                partial(_async_service_set_calendar_day, hass),
                 schema=SET_DAY_SCHEMA,
             )
 
-        # Set up the platforms
-        await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-        
-        return True
+        # Count loaded entries so services are removed with the last one
+        domain_data[DATA_LOADED_ENTRIES] = domain_data.get(DATA_LOADED_ENTRIES, 0) + 1
+        services_counted = True
+
+        # Set up the platforms while the device currency is initialized.
+        # Platforms need the software revision (external control support),
+        # so they are forwarded only after the revision reads above.
+        await asyncio.gather(
+            hass.config_entries.async_forward_entry_setups(entry, PLATFORMS),
+            _async_init_currency(manager, entry),
+        )
+    except Exception:
+        if services_counted:
+            _async_release_services(hass, domain_data)
+        await manager.cleanup()
+        raise
+
+    return True
+
+def _loaded_manager(hass: HomeAssistant, config_entry_id: str) -> EnstoThermostatManager | None:
+    """Return the manager of a loaded Ensto BLE config entry, or None."""
+    config_entry = hass.config_entries.async_get_entry(config_entry_id)
+    if config_entry is None or config_entry.domain != DOMAIN:
+        return None
+    # Entries still setting up or whose setup failed must not be targeted
+    if config_entry.state is not ConfigEntryState.LOADED:
+        return None
+    return getattr(config_entry, "runtime_data", None)
+
+async def _async_service_set_device_time(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Set device time to match Home Assistant time."""
+
+    # Extract the target entities from service call data, single or multiple
+    entity_ids = cv.ensure_list(call.data.get("entity_id"))
+
+    if not entity_ids:
+        _LOGGER.error("No target entity specified")
+        return
+
+    # Resolve each entity to its thermostat manager, one entry per device
+    manager_cache = hass.data[DOMAIN][DATA_MANAGER_CACHE]
+    entity_registry = er.async_get(hass)
+    managers = []
+    for entity_id in entity_ids:
+        manager = manager_cache.get(entity_id)
+        if manager is None:
+            # Get the entity registry entry for the target
+            entity_entry = entity_registry.async_get(entity_id)
+
+            # Get the thermostat manager from the entity's config entry
+            if entity_entry is not None and entity_entry.config_entry_id:
+                manager = _loaded_manager(hass, entity_entry.config_entry_id)
+            if manager is None:
+                _LOGGER.error("Action [Set Device Time]: %s is not a loaded Ensto BLE entity", entity_id)
+                continue
+            manager_cache[entity_id] = manager
+
+        if manager not in managers:
+            managers.append(manager)
+
+    # Get current UTC time and both timezone offsets once for all devices
+    utc_now = dt_util.utcnow()
+    ha_tz = dt_util.DEFAULT_TIME_ZONE
+    base_offset = _standard_offset_minutes(ha_tz, utc_now)
+    current_offset = utc_now.astimezone(ha_tz).utcoffset() // ONE_MINUTE
+    _LOGGER.debug("Action [Set Device Time]: setting UTC time %s", utc_now.strftime('%Y-%m-%d %H:%M:%S'))
+
+    tasks = []
+    for manager in managers:
+        # Join a time sync that is already running for this device
+        task = manager.time_sync_task
+        if task is None or task.done():
+            task = hass.async_create_task(
+                _async_sync_device_time(manager, utc_now, base_offset, current_offset)
+            )
+            manager.time_sync_task = task
+        tasks.append(asyncio.shield(task))
+
+    # Devices are independent BLE peers, so sync them concurrently
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    for manager, result in zip(managers, results):
+        if isinstance(result, BaseException):
+            _LOGGER.error("Action [Set Device Time] for [%s]: %s", manager.mac_address, result)
+
+async def _async_service_get_calendar_day(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Get calendar day programs service."""
+    # Get device_ids from target, single or multiple
+    device_ids = cv.ensure_list(call.data.get("target"))
+    if not device_ids:
+        _LOGGER.error("Action [Get Calendar Day]: no target device specified")
+        return
+
+    day = call.data["day"]
+    device_registry = dr.async_get(hass)
+    manager_cache = hass.data[DOMAIN][DATA_MANAGER_CACHE]
+
+    for device_id in device_ids:
+        manager = manager_cache.get(device_id)
+        if manager is None:
+            # Find config entry for this device
+            device_entry = device_registry.async_get(device_id)
+
+            if not device_entry:
+                _LOGGER.error("Action [Get Calendar Day %d]: device not found %s", day, device_id)
+                continue
+
+            # Get the thermostat manager from the device's Ensto config entry
+            for config_entry_id in device_entry.config_entries:
+                manager = _loaded_manager(hass, config_entry_id)
+                if manager is not None:
+                    break
+            if manager is None:
+                _LOGGER.error("Action [Get Calendar Day %d]: %s is not a loaded Ensto BLE device", day, device_id)
+                continue
+            manager_cache[device_id] = manager
+
+        # Read calendar day
+        result = await manager.read_calendar_day(day)
+
+        if result:
+            # Only format the program summary when it will be logged
+            if _LOGGER.isEnabledFor(logging.INFO):
+                enabled_programs = [p for p in result['programs'] if p['enabled']]
+                programs_str = ", ".join(f"{p['start_hour']:02d}:{p['start_minute']:02d}-{p['end_hour']:02d}:{p['end_minute']:02d} {p['temp_offset']:+.1f}°C" for p in enabled_programs)
+                _LOGGER.info("Action [Get Calendar Day %d] for [%s] (%s): %d programs [%s]",
+                        day, manager.device_name or "Unknown", manager.mac_address, len(enabled_programs), programs_str)
+        else:
+            _LOGGER.error("Action [Get Calendar Day %d] for [%s] (%s): failed to read", 
+                    day, manager.device_name or "Unknown", manager.mac_address)
+
+async def _async_service_set_calendar_day(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Set calendar day programs service."""
+    # Get device_ids from target, single or multiple
+    device_ids = cv.ensure_list(call.data.get("target"))
+    if not device_ids:
+        _LOGGER.error("Action [Set Calendar Day]: no target device specified")
+        return
+
+    day = call.data["day"]
+    programs = call.data["programs"]
+    device_registry = dr.async_get(hass)
+    manager_cache = hass.data[DOMAIN][DATA_MANAGER_CACHE]
+
+    for device_id in device_ids:
+        manager = manager_cache.get(device_id)
+        if manager is None:
+            # Find config entry for this device
+            device_entry = device_registry.async_get(device_id)
+
+            if not device_entry:
+                _LOGGER.error("Action [Set Calendar Day %d]: device not found %s", day, device_id)
+                continue
+
+            # Get the thermostat manager from the device's Ensto config entry
+            for config_entry_id in device_entry.config_entries:
+                manager = _loaded_manager(hass, config_entry_id)
+                if manager is not None:
+                    break
+            if manager is None:
+                _LOGGER.error("Action [Set Calendar Day %d]: %s is not a loaded Ensto BLE device", day, device_id)
+                continue
+            manager_cache[device_id] = manager
+
+        # Write calendar day
+        success = await manager.write_calendar_day(day, programs)
+
+        if success:
+            # Only format the program summary when it will be logged
+            if _LOGGER.isEnabledFor(logging.INFO):
+                enabled_programs = [p for p in programs if p['enabled']]
+                programs_str = ", ".join(f"{p['start_hour']:02d}:{p['start_minute']:02d}-{p['end_hour']:02d}:{p['end_minute']:02d} {p['temp_offset']:+.1f}°C" for p in enabled_programs)
+                _LOGGER.info("Action [Set Calendar Day %d] for [%s] (%s): %d programs saved [%s]",
+                        day, manager.device_name or "Unknown", manager.mac_address, len(enabled_programs), programs_str)
+        else:
+            _LOGGER.error("Action [Set Calendar Day %d] for [%s] (%s): failed to write", 
+                    day, manager.device_name or "Unknown", manager.mac_address)
+
+async def _async_init_currency(manager: EnstoThermostatManager, entry: EnstoConfigEntry) -> None:
+    """Initialize device currency from config flow."""
+    try:
+        config_currency = entry.data.get(CONF_CURRENCY, DEFAULT_CURRENCY)
+
+        # Skip the write when the device already uses the configured currency
+        current = await manager.read_energy_unit()
+        if current and current['currency_code'] == config_currency:
+            _LOGGER.debug("Device [%s]: currency already set to %s",
+                        manager.mac_address, current['currency_name'])
+            return
+
+        success = await manager.write_energy_unit(config_currency, 0.0)
         
-    except Exception as ex:
-        _LOGGER.error("Error setting up Ensto BLE: %s", str(ex))
-        raise ConfigEntryNotReady from ex
+        if not success:
+            _LOGGER.warning("Failed to set device currency")
+            
+    except Exception as e:
+        _LOGGER.warning("Failed to initialize device currency: %s", e)
+
+def _standard_offset_minutes(ha_tz, utc_now) -> int:
+    """Return the standard time (mid-January) UTC offset in minutes.
+
+    The result only depends on the timezone and the year, so it is cached
+    until either of them changes.
+    """
+    global _STANDARD_OFFSET_CACHE
+
+    cache = _STANDARD_OFFSET_CACHE
+    if cache is not None and cache[0] is ha_tz and cache[1] == utc_now.year:
+        return cache[2]
+
+    january_local = utc_now.replace(month=1, day=15).astimezone(ha_tz)
+    tz_offset = january_local.utcoffset() // ONE_MINUTE
+    _STANDARD_OFFSET_CACHE = (ha_tz, utc_now.year, tz_offset)
+    return tz_offset
+
+async def _async_sync_device_time(
+    manager: EnstoThermostatManager,
+    utc_now,
+    base_offset: int,
+    current_offset: int
+) -> None:
+    """Write Home Assistant UTC time and timezone offset to one device.
+
+    Both candidate offsets are computed once per service call by the caller:
+    the base (standard time) offset is used when the device handles DST itself,
+    the current offset otherwise.
+    """
+
+    # Use the cached DST flag, reading it from the device only when unknown
+    dst_enabled = manager.dst_enabled
+    if dst_enabled is None:
+        current_dst_settings = await manager.read_daylight_saving()
+        dst_enabled = current_dst_settings.get('enabled', False) if current_dst_settings else False
+
+    # Pick timezone offset based on DST setting (same logic as DST switch)
+    if dst_enabled:
+        # DST enabled: use base timezone offset (standard time)
+        tz_offset = base_offset
+        _LOGGER.debug("Action [Set Device Time] for [%s]: DST enabled, using base offset %d min", 
+                    manager.mac_address, tz_offset)
+    else:
+        # DST disabled: use current offset (includes DST if active)
+        tz_offset = current_offset
+        _LOGGER.debug("Action [Set Device Time] for [%s]: DST disabled, using current offset %d min", 
+                    manager.mac_address, tz_offset)
+
+    # Write UTC time, then timezone and DST settings while preserving DST state
+    if await manager.write_time_and_dst(
+        utc_now,
+        dst_enabled=dst_enabled,
+        winter_to_summer=60,
+        summer_to_winter=60,
+        timezone_offset=tz_offset
+    ):
+        _LOGGER.debug("Action [Set Device Time] for [%s]: successfully set time with DST=%s, offset=%d min",
+                    manager.mac_address, dst_enabled, tz_offset)
+
+        # Notify only datetime sensor to update, after the service call completes
+        manager.schedule_datetime_update()
+    else:
+        _LOGGER.error("Action [Set Device Time] for [%s]: failed to set time", manager.mac_address)
 
 async def async_unload_entry(hass: HomeAssistant, entry: EnstoConfigEntry) -> bool:
     """Unload a config entry."""
@@ -294,18 +408,28 @@ async def async_unload_entry(hass: HomeAssistant, entry: EnstoConfigEntry) -> bo
     if unload_ok:
         manager = entry.runtime_data
         await manager.cleanup()
-    
-    # Only remove services if this is the last config entry for the domain
-    remaining_entries = [
-        e for e in hass.config_entries.async_entries(DOMAIN) 
-        if e.entry_id != entry.entry_id
-    ]
-    if not remaining_entries:
+
+        # Forget cached service targets (entities and devices) that resolve to this device
+        domain_data = hass.data.get(DOMAIN, {})
+        manager_cache = domain_data.get(DATA_MANAGER_CACHE, {})
+        for target_id in [t for t, m in manager_cache.items() if m is manager]:
+            del manager_cache[target_id]
+
+        _async_release_services(hass, domain_data)
+
+    return unload_ok
+
+def _async_release_services(hass: HomeAssistant, domain_data: dict) -> None:
+    """Drop one loaded entry, removing services when the last one goes away."""
+    loaded_entries = domain_data.get(DATA_LOADED_ENTRIES, 1) - 1
+    domain_data[DATA_LOADED_ENTRIES] = loaded_entries
+    if loaded_entries <= 0:
         hass.services.async_remove(DOMAIN, SERVICE_SET_TIME)
         hass.services.async_remove(DOMAIN, SERVICE_GET_CALENDAR_DAY)
         hass.services.async_remove(DOMAIN, SERVICE_SET_CALENDAR_DAY)
 
-    return unload_ok
+        # Release shared data such as the cached scanner
+        hass.data.pop(DOMAIN, None)
 
 async def async_remove_entry(hass: HomeAssistant, entry: EnstoConfigEntry) -> None:
     """Remove a config entry.
@@ -9,14 +9,18 @@ import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.data_entry_flow import FlowResult
 
-from .const import DOMAIN, CURRENCY_MAP
-from .ensto_thermostat_manager import EnstoThermostatManager
+from .const import DOMAIN, CONF_CURRENCY, CURRENCY_MAP, DEFAULT_CURRENCY
+from .ensto_thermostat_manager import EnstoThermostatManager, find_devices_in_pairing_mode
 
 _LOGGER = logging.getLogger(__name__)
 
-# CONF_CURRENCY = "currency"
-CONF_CURRENCY = "Please select a currency for energy cost calculations"
-DEFAULT_CURRENCY = 1  # EUR
+def _device_label(addr: str, device) -> str:
+    """Return the selection label of a discovered device."""
+    # Include RSSI in the device name if available
+    rssi = getattr(device, 'rssi', None)
+    if rssi is not None:
+        return f"{device.name} ({addr}) [{rssi} dBm]"
+    return f"{device.name} ({addr})"
 
 class EnstoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Ensto BLE."""
@@ -47,28 +51,18 @@ class EnstoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             # Move to currency selection step
             return await self.async_step_currency()
 
-        # Initialize manager for device scanning
-        manager = EnstoThermostatManager(self.hass, "")
-        manager.setup()
-        
         # Scan for devices that are in pairing mode
-        pairing_devices = manager.find_devices_in_pairing_mode()
+        pairing_devices = find_devices_in_pairing_mode(self.hass)
 
         if not pairing_devices:
             return self.async_abort(
                 reason="No Ensto BLE devices in pairing mode. Hold BLE reset button for >0.5 seconds. Blue LED will blink."
             )
 
-        self._discovered_devices = {}
-        for addr, (device, _) in pairing_devices.items():
-            # Get RSSI value for the device
-            rssi = device.rssi if hasattr(device, 'rssi') else None
-            
-            # Include RSSI in the device name if available
-            if rssi is not None:
-                self._discovered_devices[addr] = f"{device.name} ({addr}) [{rssi} dBm]"
-            else:
-                self._discovered_devices[addr] = f"{device.name} ({addr})"
+        # Build the selection labels in a single pass
+        self._discovered_devices = {
+            addr: _device_label(addr, device) for addr, (device, _) in pairing_devices.items()
+        }
 
         return self.async_show_form(
             step_id="user",
@@ -98,12 +92,8 @@ class EnstoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 )
             
             # Create config entry with device info and currency
-            model = self._manager.model_number or "Unknown Model"
-            name = self._manager.device_name or self._mac_address
-            title = f"{model} {name}"
-            
             return self.async_create_entry(
-                title=title,
+                title=self._manager.title,
                 data={
                     "mac_address": self._mac_address,
                     CONF_CURRENCY: user_input[CONF_CURRENCY],
@@ -1,11 +1,38 @@
 """Constants for the Hass Ensto BLE integration."""
+import struct
 from datetime import timedelta
 
 # Domain identifier for Home Assistant
 DOMAIN = "hass_ensto_ble"
 
+# Keys for shared integration data in hass.data[DOMAIN]
+DATA_MANAGER_CACHE = "manager_cache"  # Service target id -> EnstoThermostatManager
+DATA_SCANNER = "scanner"  # Bluetooth scanner shared by all managers
+DATA_LOADED_ENTRIES = "loaded_entries"  # Number of loaded config entries using the services
+
+# Dispatcher signals, formatted with the device MAC address
+SIGNAL_UPDATE = "ensto_update_{}"
+SIGNAL_DATETIME_UPDATE = "ensto_datetime_update_{}"
+SIGNAL_DEBOUNCE_SECONDS = 0.05  # Window in which repeated update requests collapse into one
+
+# Seconds a vacation time read is shared by the entities polling it
+VACATION_CACHE_SECONDS = 2.0
+
 # Scan interval in seconds for the number.py, sensor.py, select.py and switch.py
-SCAN_INTERVAL = timedelta(seconds=30)
+SCAN_INTERVAL_SECONDS = 30
+SCAN_INTERVAL = timedelta(seconds=SCAN_INTERVAL_SECONDS)
+
+# Timezone offsets are written to the device in whole minutes
+ONE_MINUTE = timedelta(minutes=1)
+
+# Real time indication data is reused just under one scan interval, so all
+# sensors polling in the same cycle share one read
+REAL_TIME_CACHE_SECONDS = SCAN_INTERVAL_SECONDS - 5
+
+# Connection retry during setup: attempts and exponential backoff bounds in seconds
+CONNECT_ATTEMPTS = 4
+CONNECT_BACKOFF_BASE = 1.0
+CONNECT_BACKOFF_MAX = 8.0
 
 # Device specific constants
 MANUFACTURER_ID = 0x2806  # Ensto manufacturer ID (big endian)
@@ -28,6 +55,16 @@ ERROR_CODES_BYTE1 = {
     0x04: "Day calendar is not set"
 }
 
+# Error messages of every possible alarm byte value, indexed by the raw byte
+ALARMS_BY_BYTE0 = tuple(
+    tuple(error_msg for bit_mask, error_msg in ERROR_CODES_BYTE0.items() if code & bit_mask)
+    for code in range(256)
+)
+ALARMS_BY_BYTE1 = tuple(
+    tuple(error_msg for bit_mask, error_msg in ERROR_CODES_BYTE1.items() if code & bit_mask)
+    for code in range(256)
+)
+
 # Device operation modes
 ACTIVE_MODES = {
     1: "Manual",
@@ -35,6 +72,9 @@ ACTIVE_MODES = {
     3: "Vacation"
 }
 
+# Device operation mode names indexed directly by the mode byte
+ACTIVE_MODE_BY_CODE = tuple(ACTIVE_MODES.get(code, "Unknown") for code in range(256))
+
 # External Control modes for Force Control characteristic
 EXTERNAL_CONTROL_MODES = {
     2: "Off",
@@ -51,9 +91,12 @@ MODE_MAP = {
     5: "Force Control" # Manual control mode
 }
 
+# Heating mode names indexed directly by the mode byte
+MODE_NAME_BY_CODE = tuple(MODE_MAP.get(code, "Unknown") for code in range(256))
+
 # Define supported modes per device model using mode numbers for direct lookup
-SUPPORTED_MODES_ECO16 = {1, 2, 3, 4}
-SUPPORTED_MODES_ELTE6 = {2, 4}
+SUPPORTED_MODES_ECO16 = frozenset({1, 2, 3, 4})
+SUPPORTED_MODES_ELTE6 = frozenset({2, 4})
 
 # Floor sensor types (only the ones in Ensto app) and parameter values (as written to device by Ensto app)
 FLOOR_SENSOR_CONFIG = {
@@ -104,6 +147,11 @@ FLOOR_SENSOR_CONFIG = {
     }
 }
 
+# Config entry key and default for the currency chosen in the config flow
+# CONF_CURRENCY = "currency"
+CONF_CURRENCY = "Please select a currency for energy cost calculations"
+DEFAULT_CURRENCY = 1  # EUR
+
 # Currency code mapping for energy unit
 CURRENCY_MAP = {
     1: "EUR",  # Euro
@@ -122,6 +170,10 @@ CURRENCY_SYMBOLS = {
     5: "$"     # United States Dollar
 }
 
+# Currency names and symbols indexed directly by the currency byte
+CURRENCY_NAME_BY_CODE = tuple(CURRENCY_MAP.get(code, "Unknown") for code in range(256))
+CURRENCY_SYMBOL_BY_CODE = tuple(CURRENCY_SYMBOLS.get(code, "") for code in range(256))
+
 # Device GATT service UUIDs
 # 2.1.1. Manufacturer name string
 MANUFACTURER_NAME_UUID = "00002a29-0000-1000-8000-00805f9b34fb"
@@ -158,6 +210,7 @@ HARDWARE_REVISION_UUID = "00002a27-0000-1000-8000-00805f9b34fb"
 """
 BYTE[0-3]: uint32_t HW-version
 """
+HARDWARE_REVISION_STRUCT = struct.Struct("<I")  # HW-version
 
 # 2.2.2. Date and time
 DATE_AND_TIME_UUID = "b43f918a-b084-45c8-9b60-df648c4a4a1e"
@@ -169,6 +222,7 @@ BYTE[4]; hour 0…23
 BYTE[5]: minute 0…59
 BYTE[6]: second 0…59
 """
+DATE_AND_TIME_STRUCT = struct.Struct("<HBBBBB")  # year, month, date, hour, minute, second
 
 # 2.2.3. Day-light saving configuration
 DAYLIGHT_SAVING_UUID = "e4f66642-ed89-4c73-be57-2158c225bbde"
@@ -181,6 +235,7 @@ BYTE[4-5]: offset int16_t (+-) for summer to
 winter time as hours, compared to CET
 BYTE[6-7]: timezone offset (int16) minutes
 """
+DAYLIGHT_SAVING_STRUCT = struct.Struct("<Bxhhh")  # enabled, winter->summer, summer->winter, timezone
 
 # 2.2.4. Heating mode
 HEATING_MODE_UUID = "4eb1d6a2-19e0-4809-ba55-4a94e7d9b763"
@@ -201,6 +256,7 @@ BYTE[3]: Boost offset int8_t percentage
 BYTE[4-5]: Boost time set point in minutes uint8_t
 BYTE[6-7]: Boost time in minutes uint8_t, returns remaining boost time
 """
+BOOST_STRUCT = struct.Struct("<BhbHH")  # enabled, offset, percentage, setpoint, remaining
 
 # 2.2.6. Power control cycle
 POWER_CONTROL_CYCLE_UUID = "2cdb1af8-3f3d-4504-b56e-69a2532bc0b8"
@@ -226,6 +282,7 @@ BYTE[2-3]: High value
 ECO16: Default setting 45 C (45,00 is 4500)
 ELTE6: Do not care
 """
+FLOOR_LIMITS_STRUCT = struct.Struct("<HH")  # low value * 100, high value * 100
 
 # 2.2.8. Child lock
 CHILD_LOCK_UUID = "6e3064e2-d9a5-4ca0-9d14-017c59627330"
@@ -273,6 +330,21 @@ BYTE[7-8]: sensor broken limit adc(uint16)
 BYTE[9-10]: Resistance at 25C (uint16)
 BYTE[11-12]: Offset (int16) -0,1 = -1 etc
 """
+FLOOR_SENSOR_STRUCT = struct.Struct("<BHHHHHh")
+
+# Floor sensor configuration frames as written to FLOOR_SENSOR_TYPE_UUID, packed once per sensor type
+FLOOR_SENSOR_PAYLOAD = {
+    name: FLOOR_SENSOR_STRUCT.pack(
+        config["sensor_type"],
+        config["sensor_missing_limit"],
+        config["sensor_b_value"],
+        config["pull_up_resistor"],
+        config["sensor_broken_limit"],
+        config["resistance_25c"],
+        config["offset"],
+    )
+    for name, config in FLOOR_SENSOR_CONFIG.items()
+}
 
 # 2.2.11. Heating power
 HEATING_POWER_UUID = "53b7bf87-6cf0-4790-839a-e72d3afbec44"
@@ -282,12 +354,14 @@ Memory slot for application – not used by thermostat.
 
 BYTE[0-1], uint16_t, value as 0-9999
 """
+HEATING_POWER_STRUCT = struct.Struct("<H")  # heating power in watts
 
 # 2.2.12. Floor area to heat
 FLOOR_AREA_UUID = "5c897ab6-354c-443d-9f36-f3f7263868dd"
 """
 BYTE[0-1], uint16_t, floor area number specified by application
 """
+FLOOR_AREA_STRUCT = struct.Struct("<H")  # floor area in square meters
 
 # 2.2.13. Calibration value for room temperature
 CALIBRATION_VALUE_FOR_ROOM_TEMPERATURE_UUID = "1eca4351-b264-4db6-9c59-af4341d6ce69"
@@ -296,6 +370,7 @@ BYTE[0-1]: int8_t, range -50-+50, scaled to -5 - +5, only used in application
 
 value = (BYTE[0] + 256 * BYTE[1]) / 10
 """
+CALIBRATION_VALUE_STRUCT = struct.Struct("<h")  # calibration * 10
 
 # 2.2.14. Led brightness
 LED_BRIGHTNESS_UUID = "0bee30ff-ed95-4747-bf1b-01a60f5ff4fc"
@@ -318,6 +393,7 @@ BYTE [1]: Unused
 BYTE [2-3]: (unsigned word) Price of single energy unit scaled by multiplier of 100.
 For example price 1.2 is stored as number 120 in MCU.
 """
+ENERGY_UNIT_STRUCT = struct.Struct("<BxH")  # currency, price * 100
 
 # 2.2.16. Alarm code
 ALARM_CODE_UUID = "644b0534-cdc5-4538-8ba5-1408df8849d4"
@@ -394,6 +470,7 @@ BYTE[1-60]: calendar name
 
 NOTE! Split to several messages
 """
+CALENDAR_PROGRAM_STRUCT = struct.Struct("<BBBBhbB")  # from h:m, to h:m, temp offset, power offset, enabled
 
 # 2.2.19. Vacation time
 VACATION_TIME_UUID = "6584e9c6-4784-41aa-ac09-c899191048ae"
@@ -419,6 +496,7 @@ BYTE[14]: vacation mode: 1 = on/0 = off, read only for current vacation mode sta
 
 NOTE! Split to several messages
 """
+VACATION_TIME_STRUCT = struct.Struct("<10BhbBB")  # from/to wall clock, offsets, enabled, active
 
 # 2.2.20. Calendar mode
 CALENDAR_MODE_UUID = "636d45fd-d7be-491f-966c-380f8631b2c6"
@@ -488,9 +566,14 @@ day consume: 3 + 8 * 2 = 19
 month consume: 2 + 13 * 2 = 28
 Total: 844 + 19 + 28 = 891
 """
+MONITORING_RATIO_STRUCT = struct.Struct("<BB")  # delta from header, on/off ratio
+MONITORING_HOURLY_STRUCT = struct.Struct("<Bhh")  # delta hour, floor temp, room temp
 
 # 2.2.23. Real Time Indication temperature and mode
 REAL_TIME_INDICATION_UUID = "66ad3e6b-3135-4ada-bb2b-8b22916b21d4"
+# target temp, setting %, room temp, floor temp, relay, alarm bytes 0-1 (2-3 reserved),
+# active mode, heating mode, boost enabled, boost setpoint, boost remaining, potentiometer
+REAL_TIME_INDICATION_STRUCT = struct.Struct("<HBhhBBBxxBBBHHB")
 
 # 2.2.24. Real time indication power consumption
 REAL_TIME_INDICATION_POWER_CONSUMPTION_UUID = "c1686f28-fa1b-4791-9eca-35523fb3597e"
@@ -553,4 +636,5 @@ NOTE: Newer firmwares (1.14+) support extended functionality (19 bytes total)
 - BYTE[16]: uint8_t, unknown
 - BYTE[17]: uint8_t, mode (2=Off, 5=Temperature, 6=Temperature change)
 - BYTE[18]: uint8_t, unknown
-"""
\ No newline at end of file
+"""
+FORCE_CONTROL_STRUCT = struct.Struct("<8xHxxh3xB")  # target temp * 10, temp offset * 10, mode
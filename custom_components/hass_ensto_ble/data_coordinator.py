@@ -1,35 +1,54 @@
 import asyncio
-import time
 import logging
-from .const import REAL_TIME_INDICATION_UUID
+from .const import REAL_TIME_CACHE_SECONDS, REAL_TIME_INDICATION_UUID
 
 LOGGER = logging.getLogger(__name__)
 
 class EnstoRealTimeCoordinator:
+    __slots__ = ("_manager", "_mac", "_loop", "_last_data", "_last_update", "_refresh_task")
+
     def __init__(self, manager):
         self._manager = manager
+        self._mac = manager.mac_address  # Fixed per device, used in log messages
+        self._loop = manager.hass.loop  # Monotonic clock for the cache age
         self._last_data = None
         self._last_update = None
-        self._update_lock = asyncio.Lock()
+        self._refresh_task = None  # In-flight BLE read, shared by concurrent callers
         
-    async def get_real_time_data(self, max_age_seconds=25):
-        """Returns cached data if less than 25 seconds old, otherwise reads new."""
-        async with self._update_lock:
-            now = time.time()
-            device_name = getattr(self._manager, 'device_name', 'Unknown Device')
-            
-            if (self._last_data and self._last_update and
-                now - self._last_update < max_age_seconds):
-                LOGGER.debug("Loaded from cache for %s (%s) - age: %.1fs",
-                           device_name, self._manager.mac_address, now - self._last_update)
-                return self._last_data
-                        
-            # Read new data
+    async def get_real_time_data(self, max_age_seconds=REAL_TIME_CACHE_SECONDS):
+        """Returns cached data if less than max_age_seconds old, otherwise reads new."""
+        # The cached data is replaced in one step, so it can be read at any time
+        cached = self._get_cached_data(self._loop.time(), max_age_seconds)
+        if cached is not None:
+            return cached
+
+        # Join a read that is already running instead of queueing another one
+        task = self._refresh_task
+        if task is None or task.done():
+            task = self._manager.hass.async_create_task(self._async_refresh())
+            self._refresh_task = task
+        return await asyncio.shield(task)
+
+    async def _async_refresh(self):
+        """Read and parse new real time data from the device."""
+        now = self._loop.time()
+        if LOGGER.isEnabledFor(logging.DEBUG):
             LOGGER.debug("Reading new data for %s (%s)",
-                        device_name, self._manager.mac_address)
-            raw_data = await self._manager.read_split_characteristic(REAL_TIME_INDICATION_UUID)
-            if raw_data:
-                self._last_data = self._manager.parse_real_time_indication(raw_data)
-                self._last_update = now
-                return self._last_data
-            return None
+                        self._manager.device_name or "Unknown Device", self._mac)
+        raw_data = await self._manager.read_split_characteristic(REAL_TIME_INDICATION_UUID)
+        if raw_data:
+            self._last_data = self._manager.parse_real_time_indication(raw_data)
+            self._last_update = now
+            return self._last_data
+        return None
+
+    def _get_cached_data(self, now, max_age_seconds):
+        """Return cached data if it is younger than max_age_seconds, otherwise None."""
+        if (self._last_data and self._last_update is not None and
+            now - self._last_update < max_age_seconds):
+            if LOGGER.isEnabledFor(logging.DEBUG):
+                LOGGER.debug("Loaded from cache for %s (%s) - age: %.1fs",
+                           self._manager.device_name or "Unknown Device", self._mac,
+                           now - self._last_update)
+            return self._last_data
+        return None
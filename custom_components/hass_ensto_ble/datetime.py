@@ -3,13 +3,13 @@ import logging
 from datetime import datetime, timedelta
 
 from homeassistant.components.datetime import DateTimeEntity
+from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers import entity_registry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers import device_registry as dr
-from asyncio import sleep
 
 from .base_entity import EnstoBaseEntity
 from .const import DOMAIN
@@ -17,6 +17,12 @@ from . import EnstoConfigEntry
 
 _LOGGER = logging.getLogger(__name__)
 
+# Time given to the device to process a vacation write before reading it back
+VERIFY_DELAY_SECONDS = 0.5
+
+# Offset number states that carry no value, the device setting is used instead
+_INVALID_STATES = frozenset({STATE_UNKNOWN, STATE_UNAVAILABLE})
+
 async def async_setup_entry(
     hass: HomeAssistant, # Home Assistant instance
     entry: EnstoConfigEntry, # Config entry containing device info like MAC address
@@ -46,22 +52,26 @@ class EnstoVacationDateTimeEntity(EnstoBaseEntity, DateTimeEntity):
         
         # Set up entity attributes
         self._attr_name = f"Vacation {date_type}"
-        self._attr_unique_id = f"{dr.format_mac(self._manager.mac_address)}_vacation_{date_type}_datetime"
+        formatted_mac = dr.format_mac(self._manager.mac_address)
+        self._attr_unique_id = f"{formatted_mac}_vacation_{date_type}_datetime"
         self._attr_icon = "mdi:calendar-clock"
         
         # Initialize native value as None
         self._attr_native_value: datetime | None = None
 
+        # Unique IDs of the vacation offset numbers, resolved to entity IDs on write
+        self._temp_offset_unique_id = f"{formatted_mac}_vacation_temp_offset"
+        self._power_offset_unique_id = f"{formatted_mac}_vacation_power_offset"
+
     async def async_added_to_hass(self) -> None:
         """Set up the entity when added to HA."""
-        # Initial data fetch when first added
-        await self.async_update()
-        
+        # The initial value is fetched by update_before_add in async_setup_entry
+
         # Subscribe to signal updates
         self.async_on_remove(
             async_dispatcher_connect(
                 self.hass,
-                f"ensto_datetime_update_{self._manager.mac_address}",
+                self._manager.datetime_update_signal,
                 self._async_handle_update
             )
         )
@@ -109,18 +119,14 @@ class EnstoVacationDateTimeEntity(EnstoBaseEntity, DateTimeEntity):
            # Entity IDs are generated by HA based on device name + entity name
            registry = entity_registry.async_get(self.hass)
 
-           formatted_mac = dr.format_mac(self._manager.mac_address)
-           temp_unique_id = f"{formatted_mac}_vacation_temp_offset"
-           power_unique_id = f"{formatted_mac}_vacation_power_offset"
-
-           temp_offset_entity_id = registry.async_get_entity_id("number", DOMAIN, temp_unique_id)
-           power_offset_entity_id = registry.async_get_entity_id("number", DOMAIN, power_unique_id)
+           temp_offset_entity_id = registry.async_get_entity_id("number", DOMAIN, self._temp_offset_unique_id)
+           power_offset_entity_id = registry.async_get_entity_id("number", DOMAIN, self._power_offset_unique_id)
 
            temp_state = self.hass.states.get(temp_offset_entity_id) if temp_offset_entity_id else None
            power_state = self.hass.states.get(power_offset_entity_id) if power_offset_entity_id else None
            
-           temp_value = float(temp_state.state) if temp_state and temp_state.state not in ['unknown', 'unavailable'] else current_settings['offset_temperature']
-           power_value = int(float(power_state.state)) if power_state and power_state.state not in ['unknown', 'unavailable'] else current_settings['offset_percentage']
+           temp_value = float(temp_state.state) if temp_state and temp_state.state not in _INVALID_STATES else current_settings['offset_temperature']
+           power_value = int(float(power_state.state)) if power_state and power_state.state not in _INVALID_STATES else current_settings['offset_percentage']
            
            # Write values to the device
            success = await self._manager.write_vacation_time(
@@ -132,19 +138,11 @@ class EnstoVacationDateTimeEntity(EnstoBaseEntity, DateTimeEntity):
            )
 
            if success:
-               # After writing, read back the values to ensure synchronization
-               # Add a small delay to allow device to process the change
-               await sleep(0.5)  # Give device 500ms to process the change
-               verify_settings = await self._manager.read_vacation_time()
-               
-               if verify_settings:
-                   # Verify that the value is actually what we requested and use device's value
-                   verified_value = verify_settings['time_from'] if self._date_type == 'start' else verify_settings['time_to']
-                   self._attr_native_value = verified_value
-               else:
-                   # If verification read fails, revert to original value
-                   _LOGGER.error("Failed to verify vacation time update")
-                   self._attr_native_value = original_value
+               # Show the written value right away and let the device catch up:
+               # the vacation entities re-read the device once it has processed
+               # the change, which also picks up an automatically advanced end.
+               self._attr_native_value = time_from if self._date_type == 'start' else time_to
+               self._manager.schedule_datetime_update(VERIFY_DELAY_SECONDS)
            else:
                # If write fails, revert to original value
                _LOGGER.error("Failed to update vacation %s time", self._date_type)
@@ -1,12 +1,16 @@
 """Support for Ensto BLE devices."""
 import logging
 import asyncio
+import functools
+import random
 from typing import Optional
 from bleak import BleakClient
+from bleak.backends.characteristic import BleakGATTCharacteristic
 from bleak.exc import BleakError
 from bleak_retry_connector import establish_connection, BleakClientWithServiceCache
 from homeassistant.components import bluetooth
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from .storage_manager import EnstoStorageManager
 from datetime import datetime, timedelta
 from dateutil.relativedelta import relativedelta
@@ -14,78 +18,322 @@ from homeassistant.util import dt as dt_util
 from .data_coordinator import EnstoRealTimeCoordinator
 
 from .const import (
+    DOMAIN,
+    DATA_SCANNER,
+    CONNECT_ATTEMPTS,
+    CONNECT_BACKOFF_BASE,
+    CONNECT_BACKOFF_MAX,
     MANUFACTURER_ID,
-    ERROR_CODES_BYTE0,
-    ERROR_CODES_BYTE1,
-    ACTIVE_MODES,
+    SIGNAL_UPDATE,
+    SIGNAL_DATETIME_UPDATE,
+    SIGNAL_DEBOUNCE_SECONDS,
+    VACATION_CACHE_SECONDS,
+    ALARMS_BY_BYTE0,
+    ALARMS_BY_BYTE1,
+    ACTIVE_MODE_BY_CODE,
     EXTERNAL_CONTROL_MODES,
     MODE_MAP,
+    MODE_NAME_BY_CODE,
     CURRENCY_MAP,
-    CURRENCY_SYMBOLS,
+    CURRENCY_NAME_BY_CODE,
+    CURRENCY_SYMBOL_BY_CODE,
     DEVICE_NAME_UUID,
     MODEL_NUMBER_UUID,
     SOFTWARE_REVISION_UUID,
     HARDWARE_REVISION_UUID,
+    HARDWARE_REVISION_STRUCT,
     DATE_AND_TIME_UUID,
+    DATE_AND_TIME_STRUCT,
     DAYLIGHT_SAVING_UUID,
+    DAYLIGHT_SAVING_STRUCT,
     HEATING_MODE_UUID,
     BOOST_UUID,
+    BOOST_STRUCT,
     FLOOR_LIMITS_UUID,
+    FLOOR_LIMITS_STRUCT,
     ADAPTIVE_TEMPERATURE_CONTROL_UUID,
     HEATING_POWER_UUID,
+    HEATING_POWER_STRUCT,
     FLOOR_AREA_UUID,
+    FLOOR_AREA_STRUCT,
     CALIBRATION_VALUE_FOR_ROOM_TEMPERATURE_UUID,
+    CALIBRATION_VALUE_STRUCT,
     ENERGY_UNIT_UUID,
+    ENERGY_UNIT_STRUCT,
     CALENDAR_CONTROL_UUID,
     CALENDAR_DAY_UUID,
+    CALENDAR_PROGRAM_STRUCT,
     VACATION_TIME_UUID,
+    VACATION_TIME_STRUCT,
     CALENDAR_MODE_UUID,
     FACTORY_RESET_ID_UUID,
     MONITORING_DATA_UUID,
+    MONITORING_HOURLY_STRUCT,
+    MONITORING_RATIO_STRUCT,
+    REAL_TIME_INDICATION_STRUCT,
     REAL_TIME_INDICATION_POWER_CONSUMPTION_UUID,
     FORCE_CONTROL_UUID,
+    FORCE_CONTROL_STRUCT,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Single byte payloads for flags, modes and calendar day numbers, indexed by value
+_BYTE_VALUES = tuple(bytes((value,)) for value in range(256))
+
+# Offsets of monitoring records from their header stamp, indexed by the uint8 delta
+_HOUR_OFFSETS = tuple(timedelta(hours=delta) for delta in range(256))
+_DAY_OFFSETS = tuple(timedelta(days=delta) for delta in range(256))
+_MONTH_OFFSETS = tuple(relativedelta(months=delta) for delta in range(256))
+
+# Characteristics whose writes may skip the acknowledgement when the device
+# allows it. Safety relevant settings such as floor limits and calibration
+# are always written with response.
+_FIRE_AND_FORGET_UUIDS = frozenset({HEATING_POWER_UUID, FLOOR_AREA_UUID, ENERGY_UNIT_UUID})
+
+# Accepted range of each UTC field written by write_date_and_time
+_DATE_AND_TIME_LIMITS = (
+    ("year", 0, 9999),
+    ("month", 1, 12),
+    ("day", 1, 31),
+    ("hour", 0, 23),
+    ("minute", 0, 59),
+    ("second", 0, 59),
+)
+
+def _ble_op(action: str, default, log_disconnected: bool = True):
+    """Wrap a GATT operation with the connection check and error handling.
+
+    The wrapped coroutine only runs while a client is connected. Any failure is
+    logged and turned into ``default``; BLE errors also drop the client so the
+    next operation reconnects. Reads use None and writes use False, so a write
+    always reports a plain bool. Device information reads pass
+    ``log_disconnected=False`` to return quietly without a client.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            if self.client is None:
+                if log_disconnected:
+                    _LOGGER.error("Device not connected.")
+                return default
+            try:
+                return await func(self, *args, **kwargs)
+            except BleakError as e:
+                _LOGGER.error("BLE error, failed to %s: %s", action, e)
+                self.client = None
+                return default
+            except Exception as e:
+                _LOGGER.error("Failed to %s: %s", action, e)
+                return default
+        return wrapper
+    return decorator
+
+def get_shared_scanner(hass: HomeAssistant):
+    """Return the Bluetooth scanner shared by config flows and config entries."""
+    domain_data = hass.data.get(DOMAIN)
+    if domain_data is None:
+        domain_data = hass.data[DOMAIN] = {}
+    scanner = domain_data.get(DATA_SCANNER)
+    if scanner is None:
+        scanner = domain_data[DATA_SCANNER] = bluetooth.async_get_scanner(hass)
+    return scanner
+
+def find_ensto_devices(hass: HomeAssistant) -> dict:
+    """Scan and find Ensto devices with manufacturer 0x2806 (big endian)."""
+    discovered_devices = {}
+
+    for discovery_info in bluetooth.async_discovered_service_info(hass):
+        advertisement_data = discovery_info.advertisement
+        if (advertisement_data and
+            advertisement_data.manufacturer_data and
+            MANUFACTURER_ID in advertisement_data.manufacturer_data):
+            discovered_devices[discovery_info.address] = (discovery_info, advertisement_data)
+
+    return discovered_devices
+
+def _is_pairing_flag_set(manufacturer_data: bytes) -> bool:
+    """Return True if the PAIRINGFLAG field of Ensto manufacturer data is "1".
+
+    The data is ASCII fields separated by semicolons and the flag is the second
+    field, so it is compared in place without decoding and splitting.
+    """
+    start = manufacturer_data.find(b';') + 1
+    if not start:
+        return False
+    end = manufacturer_data.find(b';', start)
+    if end < 0:
+        end = len(manufacturer_data)
+    return end - start == 1 and manufacturer_data[start] == 0x31  # ord("1")
+
+def find_devices_in_pairing_mode(hass: HomeAssistant) -> dict:
+    """Find BLE devices that are in pairing mode (PAIRINGFLAG=1).
+
+    Uses advertisements already collected by the Bluetooth integration, so no
+    manager, connection or scanner is needed.
+    """
+    ensto_devices = find_ensto_devices(hass)
+
+    pairing_devices = {}
+    for addr, (discovery_info, adv) in ensto_devices.items():
+        try:
+            # The advertisement collected by find_ensto_devices is the latest one
+            if _is_pairing_flag_set(adv.manufacturer_data[MANUFACTURER_ID]):
+                _LOGGER.info("Device %s address %s is in pairing mode", discovery_info.name, discovery_info.address)
+                pairing_devices[addr] = (discovery_info, adv)
+            else:
+                _LOGGER.debug("Device %s address %s is NOT in pairing mode", discovery_info.name, discovery_info.address)
+
+        except Exception as e:
+            _LOGGER.error("Error parsing manufacturer data: %s", e)
+
+    return pairing_devices
+
 class EnstoThermostatManager:
     """Manager for Ensto BLE thermostats."""
 
+    __slots__ = (
+        "hass",
+        "mac_address",
+        "update_signal",
+        "datetime_update_signal",
+        "_datetime_update_handle",
+        "client",
+        "_connect_lock",
+        "scanner",
+        "storage_manager",
+        "model_number",
+        "device_name",
+        "_sw_version",
+        "_supports_external_control",
+        "hw_version",
+        "title",
+        "dst_enabled",
+        "real_time_coordinator",
+        "_device_info",
+        "_device_info_key",
+        "time_sync_task",
+        "_characteristics",
+        "_characteristics_client",
+        "_vacation_cache",
+        "_vacation_cache_time",
+        "_factory_reset_id",
+        "_factory_reset_id_bytes",
+    )
+
     def __init__(self, hass: HomeAssistant, mac_address: str) -> None:
         """Initialize the manager."""
         self.hass = hass
         self.mac_address = mac_address
+        self.update_signal = SIGNAL_UPDATE.format(mac_address)
+        self.datetime_update_signal = SIGNAL_DATETIME_UPDATE.format(mac_address)
+        self._datetime_update_handle = None
         self.client: Optional[BleakClient] = None
         self._connect_lock = asyncio.Lock()
         self.scanner = None
         self.storage_manager = EnstoStorageManager(hass)
         self.model_number = None
         self.device_name = None
+        self.sw_version = None  # Also resets the cached external control support
+        self.hw_version = None
+        self.title = None
+        self.dst_enabled = None  # Last known DST flag, None until read or written
         self.real_time_coordinator = None
+        self._device_info = None
+        self._device_info_key = None
+        self.time_sync_task = None  # In-flight set_device_time sync, shared by concurrent calls
+        self._characteristics = {}  # UUID -> GATT characteristic of the current connection
+        self._characteristics_client = None  # Client the characteristic cache belongs to
+        self._vacation_cache = None  # Last parsed vacation time settings
+        self._vacation_cache_time = 0.0  # Loop time of the cached vacation read
+        self._factory_reset_id = None  # Factory Reset ID last written to the device
+        self._factory_reset_id_bytes = None  # Its encoded payload
+
+    @property
+    def device_info(self) -> dict:
+        """Return device info for Home Assistant device registry.
+
+        Returns a dictionary containing:
+        - unique_id: MAC address as the device identifier
+        - name: device name or default name with MAC
+        - manufacturer: fixed value "Ensto"
+        - model: model number if available
+        - sw_version: software version if available
+        - hw_version: hardware version if available
+
+        The dictionary is rebuilt only when one of the source fields changes.
+        """
+        key = (self.device_name, self.model_number, self.sw_version, self.hw_version)
+        if self._device_info is None or key != self._device_info_key:
+            self._device_info = {
+                "identifiers": {(DOMAIN, self.mac_address)},
+                "name": self.device_name or f"Ensto Thermostat {self.mac_address}",
+                "manufacturer": "Ensto",
+                "model": self.model_number or "model name not available",
+                "sw_version": self.sw_version,
+                "hw_version": self.hw_version,
+            }
+            self._device_info_key = key
+        return self._device_info
+
+    def _update_title(self) -> None:
+        """Recompute the config entry title after model number or device name changes."""
+        self.title = f"{self.model_number or 'Unknown Model'} {self.device_name or self.mac_address}"
+
+    def schedule_datetime_update(self, delay: float = SIGNAL_DEBOUNCE_SECONDS) -> None:
+        """Notify date and time listeners after a short delay.
+
+        Requests made while a notification is already pending are dropped, so
+        bursts of writes result in a single refresh of the listening entities.
+        """
+        if self._datetime_update_handle is not None:
+            return
+        self._datetime_update_handle = self.hass.loop.call_later(delay, self._send_datetime_update)
+
+    def _send_datetime_update(self) -> None:
+        """Send the pending date and time update signal."""
+        self._datetime_update_handle = None
+        async_dispatcher_send(self.hass, self.datetime_update_signal)
 
     def get_real_time_coordinator(self):
         if not self.real_time_coordinator:
             self.real_time_coordinator = EnstoRealTimeCoordinator(self)
         return self.real_time_coordinator
 
-    def supports_external_control(self) -> bool:
-        """Check if firmware supports external control (1.14+)."""
-        if not hasattr(self, 'sw_version') or not self.sw_version:
+    @property
+    def sw_version(self) -> Optional[str]:
+        """Software revision string of the device, None until read."""
+        return self._sw_version
+
+    @sw_version.setter
+    def sw_version(self, value: Optional[str]) -> None:
+        """Store the software revision and the features it enables."""
+        self._sw_version = value
+        self._supports_external_control = self._parse_external_control_support(value)
+
+    @staticmethod
+    def _parse_external_control_support(sw_version: Optional[str]) -> bool:
+        """Return True if the firmware version is 1.14 or newer."""
+        if not sw_version:
             return False
         try:
             # Parse version like "1.14.0;..." -> 1.14
-            version_str = self.sw_version.split(';')[0]
+            version_str = sw_version.split(';')[0]
             parts = version_str.split('.')
             major = int(parts[0])
             minor = int(parts[1]) if len(parts) > 1 else 0
             return (major, minor) >= (1, 14)
         except (ValueError, IndexError):
-            _LOGGER.debug("Could not parse firmware version: %s", self.sw_version)
+            _LOGGER.debug("Could not parse firmware version: %s", sw_version)
             return False
 
+    def supports_external_control(self) -> bool:
+        """Check if firmware supports external control (1.14+)."""
+        return self._supports_external_control
+
     def setup(self) -> None:
         """Set up the scanner when needed."""
-        self.scanner = bluetooth.async_get_scanner(self.hass)
+        self.scanner = get_shared_scanner(self.hass)
 
     async def initialize(self) -> None:
         """Initialize the connection."""
@@ -93,19 +341,34 @@ class EnstoThermostatManager:
 
     async def cleanup(self) -> None:
         """Clean up the connection."""
+        if self._datetime_update_handle is not None:
+            self._datetime_update_handle.cancel()
+            self._datetime_update_handle = None
+
         try:
-            if self.client and self.client.is_connected:
-                await self.client.disconnect()
+            client = self.client
+            self.client = None
+            if client is not None and client.is_connected:
+                await client.disconnect()
         except Exception as e:
             _LOGGER.debug("Error during cleanup disconnect: %s", e)
         finally:
             self.client = None
+            self.dst_enabled = None
+            self._vacation_cache = None
+
+    def _on_disconnected(self, client: BleakClient) -> None:
+        """Forget the client when the link drops so connection checks stay cheap."""
+        if client is self.client:
+            _LOGGER.debug("Device [%s]: disconnected", self.mac_address)
+            self.client = None
+            self._vacation_cache = None
 
     async def connect(self) -> None:
         """Establish connection to the device."""
-        if await self._connect_lock.acquire():
+        async with self._connect_lock:
             try:
-                if self.client and self.client.is_connected:
+                if self.client is not None:
                     return
 
                 _LOGGER.debug("Finding device %s", self.mac_address)
@@ -115,7 +378,14 @@ class EnstoThermostatManager:
 
                 # Use bleak-retry-connector
                 _LOGGER.debug("Device [%s]: establishing connection", self.mac_address)
-                self.client = await establish_connection(BleakClientWithServiceCache, device, self.mac_address)
+                self.client = await establish_connection(
+                    BleakClientWithServiceCache,
+                    device,
+                    self.mac_address,
+                    disconnected_callback=self._on_disconnected,
+                )
+                self.dst_enabled = None
+                self._vacation_cache = None
                 _LOGGER.debug("Device [%s]: connection established", self.mac_address)
 
                 # always pair to set encryption
@@ -146,9 +416,13 @@ class EnstoThermostatManager:
                 # Write Factory Reset ID to device
                 await self.write_factory_reset_id(stored_id)
                 
-                # Read and store model number and device name after successful connection
-                self.model_number = await self.read_model_number()
-                self.device_name = await self.read_device_name()
+                # Read and store model number and device name after successful connection,
+                # both requests are queued on the link at once
+                self.model_number, self.device_name = await asyncio.gather(
+                    self.read_model_number(),
+                    self.read_device_name(),
+                )
+                self._update_title()
                 
                 _LOGGER.info("Successfully verified Factory Reset ID and read model number")
 
@@ -156,16 +430,30 @@ class EnstoThermostatManager:
                 _LOGGER.error("Failed to connect: %s", str(e))
                 self.client = None
                 raise
-            finally:
-                self._connect_lock.release()
-        else:
-            raise Exception("Already connecting")
 
     async def ensure_connection(self) -> None:
         """Ensure that we have a connection to the device."""
-        if not self.client or not self.client.is_connected:
+        if self.client is None:
             await self.connect()
 
+    async def connect_with_backoff(self, attempts: int = CONNECT_ATTEMPTS) -> None:
+        """Connect to the device, retrying with exponential backoff and jitter.
+
+        Raises the error of the last attempt if the device could not be reached.
+        """
+        for attempt in range(attempts):
+            try:
+                await self.ensure_connection()
+                return
+            except Exception as e:
+                if attempt == attempts - 1:
+                    raise
+                delay = min(CONNECT_BACKOFF_MAX, CONNECT_BACKOFF_BASE * 2 ** attempt)
+                delay += random.uniform(0, delay / 2)
+                _LOGGER.debug("Device [%s]: connection attempt %d failed (%s), retrying in %.1f s",
+                            self.mac_address, attempt + 1, e, delay)
+                await asyncio.sleep(delay)
+
     async def write_device_info(self, device_address: str, factory_reset_id: int) -> None:
         """Write device info to Home Assistant storage."""
         await self.storage_manager.async_save_device_data(device_address, factory_reset_id)
@@ -177,43 +465,10 @@ class EnstoThermostatManager:
             return device_data.get("factory_reset_id")
         return None
 
-    def find_ensto_devices(self):
-        """Scan and find Ensto devices with manufacturer 0x2806 (big endian)."""
-        discovered_devices = {}
-        
-        for discovery_info in bluetooth.async_discovered_service_info(self.hass):
-            advertisement_data = discovery_info.advertisement
-            if (advertisement_data and
-                advertisement_data.manufacturer_data and
-                MANUFACTURER_ID in advertisement_data.manufacturer_data):
-                discovered_devices[discovery_info.address] = (discovery_info, advertisement_data)
-        
-        return discovered_devices
-
-    def find_devices_in_pairing_mode(self):
-        """Find BLE devices that are in pairing mode (PAIRINGFLAG=1)."""
-        ensto_devices = self.find_ensto_devices()
-        
-        pairing_devices = {}
-        for addr, (discovery_info, adv) in ensto_devices.items():
-            try:
-                service_info = bluetooth.async_last_service_info(self.hass, addr)
-                fields = service_info.manufacturer_data[MANUFACTURER_ID].decode('ascii').split(';')
-                if len(fields) >= 2 and fields[1] == "1":
-                    _LOGGER.info("Device %s address %s is in pairing mode", discovery_info.name, discovery_info.address)
-                    pairing_devices[addr] = (discovery_info, adv)
-                else:
-                    _LOGGER.debug("Device %s address %s is NOT in pairing mode", discovery_info.name, discovery_info.address)
-
-            except Exception as e:
-                _LOGGER.error("Error parsing manufacturer data: %s", e)
-                
-        return pairing_devices
-
     async def read_factory_reset_id(self) -> Optional[int]:
         """Read Factory Reset ID from the BLE device."""
         try:
-            data = await self.client.read_gatt_char(FACTORY_RESET_ID_UUID)
+            data = await self.client.read_gatt_char(self.get_characteristic(FACTORY_RESET_ID_UUID))
             factory_reset_id = int.from_bytes(data[:4], byteorder="little")
             return factory_reset_id
         except Exception as e:
@@ -222,8 +477,12 @@ class EnstoThermostatManager:
     async def write_factory_reset_id(self, factory_reset_id: int) -> None:
         """Write the Factory Reset ID to the BLE device."""
         try:
-            id_bytes = factory_reset_id.to_bytes(4, byteorder="little")
-            await self.client.write_gatt_char(FACTORY_RESET_ID_UUID, id_bytes)
+            # The ID is fixed per device, encode it only when it changes
+            if factory_reset_id != self._factory_reset_id:
+                self._factory_reset_id_bytes = factory_reset_id.to_bytes(4, byteorder="little")
+                self._factory_reset_id = factory_reset_id
+            id_bytes = self._factory_reset_id_bytes
+            await self.client.write_gatt_char(self.get_characteristic(FACTORY_RESET_ID_UUID), id_bytes)
         except Exception as e:
             raise Exception("Failed to write factory reset ID: %s", e)
 
@@ -242,29 +501,35 @@ class EnstoThermostatManager:
         """
         await self.ensure_connection()
         
-        combined_data = bytearray()
+        # Data portions of all packets, joined once at the end
+        chunks = []
         more_data = True
         
         try:
             while more_data:
                 # Read next packet
-                packet = await self.client.read_gatt_char(characteristic_uuid)
+                packet = await self.client.read_gatt_char(self.get_characteristic(characteristic_uuid))
                 
                 if not packet or len(packet) < 1:
                     break
                     
-                header = packet[0]
-                data = packet[1:]
-                
-                # Add data portion to combined data
-                combined_data.extend(data)
+                # Keep the data portion without copying it
+                chunks.append(memoryview(packet)[1:])
                 
                 # Check if this was the last packet (0x40 bit set in header)
-                if header & 0x40:
+                if packet[0] & 0x40:
                     more_data = False
                     
-            # Remove padding bytes (zeros from the end)
-            return bytes(combined_data).rstrip(b'\x00')
+            # Remove padding bytes (zeros from the end) on the trailing
+            # packets only, so the joined buffer is built once
+            while chunks:
+                tail = chunks[-1].tobytes().rstrip(b'\x00')
+                if tail:
+                    chunks[-1] = tail
+                    break
+                chunks.pop()
+
+            return b''.join(chunks)
             
         except BleakError as e:
             _LOGGER.error("Error reading characteristic: %s", e)
@@ -295,49 +560,30 @@ class EnstoThermostatManager:
             return {}
 
         try:
-            # Target temperature (uint16, scaled)
-            target_temp = int.from_bytes(data[0:2], byteorder='little') / 10
-            
-            # Temperature setting percentage
-            temp_setting_percent = data[2]
-            
-            # Room temperature (int16, scaled)
-            room_temp = int.from_bytes(data[3:5], byteorder='little', signed=True) / 10
-            
-            # Floor temperature (int16, scaled)
-            floor_temp = int.from_bytes(data[5:7], byteorder='little', signed=True) / 10
+            (target_raw, temp_setting_percent, room_raw, floor_raw, relay, alarm_byte0, alarm_byte1,
+             active_mode_code, heating_mode_code, boost, boost_setpoint, boost_remaining,
+             potentiometer_value) = REAL_TIME_INDICATION_STRUCT.unpack_from(data)
+
+            # Target temperature (uint16), room and floor temperature (int16), scaled
+            target_temp = target_raw / 10
+            room_temp = room_raw / 10
+            floor_temp = floor_raw / 10
             
             # Active relay state
-            relay_active = bool(data[7])
+            relay_active = bool(relay)
             
             # Parse alarm codes (first 2 bytes only, as others are reserved)
-            alarm_bytes = data[8:10]
-            active_alarms = []
-            
-            # Parse each byte and its corresponding error codes
-            error_code_maps = [ERROR_CODES_BYTE0, ERROR_CODES_BYTE1]
-            for byte_idx, error_map in enumerate(error_code_maps):
-                byte_value = alarm_bytes[byte_idx]
-                for bit_mask, error_msg in error_map.items():
-                    if byte_value & bit_mask:
-                        active_alarms.append(error_msg)
-            
-            # Store both raw code and parsed alarms
-            alarm_code = int.from_bytes(alarm_bytes, byteorder='little')
+            alarm_code = alarm_byte0 | (alarm_byte1 << 8)
+            active_alarms = ALARMS_BY_BYTE0[alarm_byte0] + ALARMS_BY_BYTE1[alarm_byte1]
 
             # Active modes
-            active_mode = ACTIVE_MODES.get(data[12], "Unknown")
+            active_mode = ACTIVE_MODE_BY_CODE[active_mode_code]
 
             # Active heating mode
-            heating_mode = MODE_MAP.get(data[13], "Unknown")
+            heating_mode = MODE_NAME_BY_CODE[heating_mode_code]
 
-            # Boost settings
-            boost_enabled = bool(data[14])
-            boost_setpoint = int.from_bytes(data[15:17], byteorder='little')
-            boost_remaining = int.from_bytes(data[17:19], byteorder='little')
-            
-            # Potentiometer value
-            potentiometer_value = data[19]
+            # Boost settings, setpoint and remaining time in minutes
+            boost_enabled = bool(boost)
             
             return {
                 "target_temperature": target_temp,
@@ -358,27 +604,15 @@ class EnstoThermostatManager:
             _LOGGER.error("Error parsing real time indication: %s", e)
             return {}
 
+    @_ble_op("read model number", None, log_disconnected=False)
     async def read_model_number(self) -> Optional[str]:
         """Read model number via GATT characteristic."""
-        try:
-            if not self.client or not self.client.is_connected:
-                return None
-                
-            # Read the raw bytes
-            model_number_raw = await self.client.read_gatt_char(MODEL_NUMBER_UUID)
+        # Read the raw bytes
+        model_number_raw = await self.client.read_gatt_char(self.get_characteristic(MODEL_NUMBER_UUID))
 
-            # Decode using UTF-8
-            model_number = model_number_raw.decode('utf-8')
-            return model_number
-            
-        except BleakError as e:
-            _LOGGER.error("BLE error reading model number: %s", e)
-            self.client = None
-            return None
-            
-        except Exception as e:
-            _LOGGER.error("Failed to read model number: %s", e)
-            return None
+        # Decode using UTF-8
+        model_number = model_number_raw.decode('utf-8')
+        return model_number
 
     async def set_heating_mode(self, mode: int) -> None:
         """Set heating mode."""
@@ -394,208 +628,108 @@ class EnstoThermostatManager:
         except Exception as e:
             _LOGGER.error("Failed to set adaptive temperature control: %s", e)
 
+    @_ble_op("read boost config", None)
     async def read_boost(self) -> dict:
         """Read boost configuration from device."""
-        try:
-            if not self.client or not self.client.is_connected:
-                _LOGGER.error("Device not connected.")
-                return None
-
-            # Read raw data from device
-            data = await self.client.read_gatt_char(BOOST_UUID)
-
-            # Parse data
-            enabled = bool(data[0])  # First byte is enable flag
-            
-            # Parse temperature offset (bytes 1-2 as signed int16)
-            # Convert from raw value (2150 = 21.5 degrees)
-            offset_raw = int.from_bytes(data[1:3], byteorder='little', signed=True)
-            offset_degrees = offset_raw / 100.0
-            
-            # Parse percentage offset (byte 3)
-            # Convert percentage offset byte to signed int (range -128 to 127)
-            offset_percentage = int.from_bytes([data[3]], byteorder='little', signed=True)
-            
-            # Parse time setpoint (bytes 4-5 as unsigned int16)
-            setpoint_minutes = int.from_bytes(data[4:6], byteorder='little')
-            
-            # Parse remaining time (bytes 6-7 as unsigned int16)
-            remaining_minutes = int.from_bytes(data[6:8], byteorder='little')
-
-            return {
-                'enabled': enabled,
-                'offset_degrees': offset_degrees,
-                'offset_percentage': offset_percentage,
-                'setpoint_minutes': setpoint_minutes,
-                'remaining_minutes': remaining_minutes
-            }
-
-        except BleakError as e:
-            _LOGGER.error("BLE error reading boost config: %s", e)
-            self.client = None
-            return None
-            
-        except Exception as e:
-            _LOGGER.error("Failed to read boost config: %s", e)
-            return None
-
+        # Read raw data from device
+        data = await self.client.read_gatt_char(self.get_characteristic(BOOST_UUID))
+
+        # Parse data: enable flag, temperature offset (signed int16, 2150 = 21.5 degrees),
+        # percentage offset (signed byte), time setpoint and remaining time in minutes
+        (enabled, offset_raw, offset_percentage,
+         setpoint_minutes, remaining_minutes) = BOOST_STRUCT.unpack_from(data)
+        enabled = bool(enabled)
+        offset_degrees = offset_raw / 100.0
+
+        return {
+            'enabled': enabled,
+            'offset_degrees': offset_degrees,
+            'offset_percentage': offset_percentage,
+            'setpoint_minutes': setpoint_minutes,
+            'remaining_minutes': remaining_minutes
+        }
+
+    @_ble_op("write boost config", False)
     async def write_boost(self, enabled: bool, offset_degrees: float, offset_percentage: int, duration_minutes: int) -> bool:
         """Write boost configuration to device."""
-        try:
-            if not self.client or not self.client.is_connected:
-                _LOGGER.error("Device not connected.")
-                return False
-
-            # Validate input values
-            if not (-20 <= offset_degrees <= 20):
-                raise ValueError("Temperature offset must be between -20 and 20 degrees")
-            if not (-100 <= offset_percentage <= 100):
-                raise ValueError("Percentage offset must be between -100 and 100")
-            if not (0 <= duration_minutes <= 65535):  # max value for uint16
-                raise ValueError("Duration must be between 0 and 65535 minutes")
-
-            # Convert temperature to raw value (multiply by 100)
-            # e.g., 21.5 degrees becomes 2150
-            offset_raw = int(offset_degrees * 100)
-
-            # Create data packet (8 bytes)
-            data = bytearray(8)
-            data[0] = 1 if enabled else 0  # Enable/disable flag
-            
-            # Temperature offset as signed int16
-            data[1:3] = offset_raw.to_bytes(2, byteorder='little', signed=True)
-            
-            # Percentage offset
-            # Convert percentage offset to signed int8
-            data[3] = offset_percentage.to_bytes(1, byteorder='little', signed=True)[0]
-            
-            # Duration setpoint as unsigned int16
-            data[4:6] = duration_minutes.to_bytes(2, byteorder='little')
-            
-            # Remaining time bytes are left as 0
-            data[6:8] = (0).to_bytes(2, byteorder='little')
-            
-            # Write to device
-            await self.client.write_gatt_char(BOOST_UUID, data, response=True)
-            return True
-
-        except BleakError as e:
-            _LOGGER.error("BLE error writing boost config: %s", e)
-            self.client = None
-            return None
-            
-        except Exception as e:
-            _LOGGER.error("Failed to write boost config: %s", e)
-            return False
+        # Validate input values
+        if not (-20 <= offset_degrees <= 20):
+            raise ValueError("Temperature offset must be between -20 and 20 degrees")
+        if not (-100 <= offset_percentage <= 100):
+            raise ValueError("Percentage offset must be between -100 and 100")
+        if not (0 <= duration_minutes <= 65535):  # max value for uint16
+            raise ValueError("Duration must be between 0 and 65535 minutes")
+
+        # Convert temperature to raw value (multiply by 100)
+        # e.g., 21.5 degrees becomes 2150
+        offset_raw = int(offset_degrees * 100)
+
+        # Create data packet (8 bytes): enable flag, temperature offset (signed int16),
+        # percentage offset (signed int8), duration setpoint (uint16) and the
+        # remaining time, which is left as 0
+        data = BOOST_STRUCT.pack(1 if enabled else 0, offset_raw, offset_percentage, duration_minutes, 0)
+        
+        # Write to device
+        await self.client.write_gatt_char(self.get_characteristic(BOOST_UUID), data, response=True)
+        return True
 
+    @_ble_op("read heating mode", None)
     async def read_heating_mode(self) -> dict:
         """Read heating mode configuration from device."""
-        try:
-            if not self.client or not self.client.is_connected:
-                _LOGGER.error("Device not connected.")
-                return None
+        # Read raw data from device
+        data = await self.client.read_gatt_char(self.get_characteristic(HEATING_MODE_UUID))
 
-            # Read raw data from device
-            data = await self.client.read_gatt_char(HEATING_MODE_UUID)
-
-            # Get mode number from first byte
-            mode_number = data[0]
-            mode_name = MODE_MAP.get(mode_number, "Unknown")
-
-            return {
-                'mode_number': mode_number,
-                'mode_name': mode_name
-            }
+        # Get mode number from first byte
+        mode_number = data[0]
+        mode_name = MODE_NAME_BY_CODE[mode_number]
 
-        except BleakError as e:
-            _LOGGER.error("BLE error reading heating mode: %s", e)
-            self.client = None
-            return None
-        
-        except Exception as e:
-            _LOGGER.error("Failed to read heating mode: %s", e)
-            return None
+        return {
+            'mode_number': mode_number,
+            'mode_name': mode_name
+        }
 
+    @_ble_op("write heating mode", False)
     async def write_heating_mode(self, mode: int) -> bool:
         """Write heating mode configuration to device."""
-        try:
-            if not self.client or not self.client.is_connected:
-                _LOGGER.error("Device not connected.")
-                return False
-
-            # Validate input mode
-            if mode not in MODE_MAP:
-                raise ValueError(
-                    "Invalid mode. Must be: "
-                    "1 (Floor), 2 (Room), 3 (Combination), "
-                    "4 (Power), or 5 (Force Control)"
-                )
-
-            # Pack data - just a single byte
-            data = bytes([mode])
-            
-            # Write to device
-            await self.client.write_gatt_char(HEATING_MODE_UUID, data, response=True)
-            return True
+        # Validate input mode
+        if mode not in MODE_MAP:
+            raise ValueError(
+                "Invalid mode. Must be: "
+                "1 (Floor), 2 (Room), 3 (Combination), "
+                "4 (Power), or 5 (Force Control)"
+            )
 
-        except BleakError as e:
-            _LOGGER.error("BLE error writing heating mode: %s", e)
-            self.client = None
-            return None
+        # Pack data - just a single byte
+        data = _BYTE_VALUES[mode]
         
-        except Exception as e:
-            _LOGGER.error("Failed to write heating mode: %s", e)
-            return False
+        # Write to device
+        await self.client.write_gatt_char(self.get_characteristic(HEATING_MODE_UUID), data, response=True)
+        return True
 
+    @_ble_op("read adaptive temperature control", None)
     async def read_adaptive_temp_control(self) -> dict:
         """Read adaptive temperature control setting from device."""
-        try:
-            if not self.client or not self.client.is_connected:
-                _LOGGER.error("Device not connected.")
-                return None
-
-            # Read raw data from device
-            data = await self.client.read_gatt_char(ADAPTIVE_TEMPERATURE_CONTROL_UUID)
+        # Read raw data from device
+        data = await self.client.read_gatt_char(self.get_characteristic(ADAPTIVE_TEMPERATURE_CONTROL_UUID))
 
-            # Parse first byte as boolean
-            enabled = bool(data[0])
+        # Parse first byte as boolean
+        enabled = bool(data[0])
 
-            return {
-                'enabled': enabled
-            }
-
-        except BleakError as e:
-            _LOGGER.error("BLE error reading adaptive temperature control: %s", e)
-            self.client = None
-            return None
-        
-        except Exception as e:
-            _LOGGER.error("Failed to read adaptive temperature control: %s", e)
-            return None
+        return {
+            'enabled': enabled
+        }
 
+    @_ble_op("write adaptive temperature control", False)
     async def write_adaptive_temp_control(self, enabled: bool) -> bool:
         """Write adaptive temperature control setting to device."""
-        try:
-            if not self.client or not self.client.is_connected:
-                _LOGGER.error("Device not connected.")
-                return False
-
-            # Create single byte data
-            data = bytes([1 if enabled else 0])
-            
-            # Write to device
-            await self.client.write_gatt_char(ADAPTIVE_TEMPERATURE_CONTROL_UUID, data, response=True)
-            return True
-
-        except BleakError as e:
-            _LOGGER.error("BLE error writing adaptive temperature control: %s", e)
-            self.client = None
-            return None
+        # Create single byte data
+        data = _BYTE_VALUES[1 if enabled else 0]
         
-        except Exception as e:
-            _LOGGER.error("Failed to write adaptive temperature control: %s", e)
-            return False
+        # Write to device
+        await self.client.write_gatt_char(self.get_characteristic(ADAPTIVE_TEMPERATURE_CONTROL_UUID), data, response=True)
+        return True
 
+    @_ble_op("read device name", None, log_disconnected=False)
     async def read_device_name(self) -> Optional[str]:
         """
         Read device name via GATT characteristic.
@@ -603,32 +737,19 @@ class EnstoThermostatManager:
         Returns:
             str - Device name if successful, None if failed or device is unnamed
         """
-        try:
-            if not self.client or not self.client.is_connected:
-                return None
-                
-            # Read the raw bytes
-            raw_data = await self.client.read_gatt_char(DEVICE_NAME_UUID)
-            
-            # Skip first byte and strip null bytes
-            name_bytes = raw_data[1:].split(b'\x00')[0]
-            
-            # If no actual name data, return None
-            if not name_bytes:
-                return None
-                
-            # Decode using UTF-8 to handle Nordic characters
-            device_name = name_bytes.decode('utf-8')
-            return device_name
-
-        except BleakError as e:
-            _LOGGER.error("BLE error reading device name: %s", e)
-            self.client = None
-            return None
+        # Read the raw bytes
+        raw_data = await self.client.read_gatt_char(self.get_characteristic(DEVICE_NAME_UUID))
         
-        except Exception as e:
-            _LOGGER.error("Failed to read device name: %s", e)
+        # Skip first byte and strip null bytes
+        name_bytes = raw_data[1:].split(b'\x00')[0]
+        
+        # If no actual name data, return None
+        if not name_bytes:
             return None
+            
+        # Decode using UTF-8 to handle Nordic characters
+        device_name = name_bytes.decode('utf-8')
+        return device_name
 
     async def write_split_characteristic(self, characteristic_uuid: str, data: bytes) -> bool:
         """
@@ -663,21 +784,20 @@ class EnstoThermostatManager:
                     header = 0x40
                 
                 # Combine header and data
-                packet = bytearray([header]) + chunk_data
+                packet = _BYTE_VALUES[header] + chunk_data
                 
                 # Debug log for each packet
-                _LOGGER.debug(
-                    f"Writing chunk {current_chunk + 1}/{total_chunks}:"
-                    f"\nHeader: 0x{header:02x}"
-                    f"\nChunk data (bytes): {chunk_data.hex()}"
-                    f"\nFull packet (bytes): {packet.hex()}"
-                )
-                
-                # Write the packet
-                await self.client.write_gatt_char(characteristic_uuid, packet, response=True)
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug(
+                        f"Writing chunk {current_chunk + 1}/{total_chunks}:"
+                        f"\nHeader: 0x{header:02x}"
+                        f"\nChunk data (bytes): {chunk_data.hex()}"
+                        f"\nFull packet (bytes): {packet.hex()}"
+                    )
                 
-                # Small delay between packets
-                await asyncio.sleep(0.1)
+                # Write the packet. The write is acknowledged by the device, which
+                # already orders it before the next packet, so no delay is needed.
+                await self.client.write_gatt_char(self.get_characteristic(characteristic_uuid), packet, response=True)
             
             return True
             
@@ -687,6 +807,7 @@ class EnstoThermostatManager:
             self.client = None
             raise
 
+    @_ble_op("read date and time from device", None)
     async def read_date_and_time(self) -> dict:
         """Read date and time from device in UTC.
 
@@ -700,45 +821,27 @@ class EnstoThermostatManager:
                 second (int): Second (0-59)
             None: If read fails
         """
-        try:
-            if not self.client or not self.client.is_connected:
-                _LOGGER.error("Device not connected.")
-                return None
-
-            # Read raw data from device
-            data = await self.client.read_gatt_char(DATE_AND_TIME_UUID)
-
-            # Ensure input is the correct length
-            if len(data) != 7:
-                _LOGGER.error("Device timestamp must be 7 bytes long.")
-                return None
-            
-            # Extract individual bytes
-            year = int.from_bytes(data[0:2], byteorder="little")
-            month = data[2]
-            date = data[3]
-            hour = data[4]
-            minute = data[5]
-            second = data[6]
-
-            return {
-                "year": year,
-                "month": month,
-                "day": date,
-                "hour": hour,
-                "minute": minute,
-                "second": second
-            }
+        # Read raw data from device
+        data = await self.client.read_gatt_char(self.get_characteristic(DATE_AND_TIME_UUID))
 
-        except BleakError as e:
-            _LOGGER.error("BLE error reading date and time from device: %s", e)
-            self.client = None
+        # Ensure input is the correct length
+        if len(data) != 7:
+            _LOGGER.error("Device timestamp must be 7 bytes long.")
             return None
         
-        except Exception as e:
-            _LOGGER.error("Failed to read date and time from device: %s", e)
-            return None
-
+        # Extract individual fields
+        year, month, date, hour, minute, second = DATE_AND_TIME_STRUCT.unpack(data)
+
+        return {
+            "year": year,
+            "month": month,
+            "day": date,
+            "hour": hour,
+            "minute": minute,
+            "second": second
+        }
+
+    @_ble_op("write UTC time to device", False)
     async def write_date_and_time(self, year: int, month: int, day: int, hour: int, minute: int, second: int) -> bool:
         """Write date and time to device.
         
@@ -761,31 +864,14 @@ class EnstoThermostatManager:
             maintained with UTC timestamps. All timestamps must be in UTC regardless 
             of the device's timezone settings.
         """
-        try:
-            if not self.client or not self.client.is_connected:
-                _LOGGER.error("Device not connected.")
-                return False
-
-            # Validate input values
-            if not (0 <= year <= 9999):
-                _LOGGER.error("Invalid UTC year: %s", year)
-                return False
-            if not (1 <= month <= 12):
-                _LOGGER.error("Invalid UTC month: %s", month)
-                return False
-            if not (1 <= day <= 31):
-                _LOGGER.error("Invalid UTC day: %s", day)
-                return False
-            if not (0 <= hour <= 23):
-                _LOGGER.error("Invalid UTC hour: %s", hour)
-                return False
-            if not (0 <= minute <= 59):
-                _LOGGER.error("Invalid UTC minute: %s", minute)
-                return False
-            if not (0 <= second <= 59):
-                _LOGGER.error("Invalid UTC second: %s", second)
+        # Validate input values against the shared limits table
+        values = (year, month, day, hour, minute, second)
+        for (name, low, high), value in zip(_DATE_AND_TIME_LIMITS, values):
+            if not low <= value <= high:
+                _LOGGER.error("Invalid UTC %s: %s", name, value)
                 return False
 
+        if _LOGGER.isEnabledFor(logging.DEBUG):
             _LOGGER.debug(
                 "Writing UTC time to %s for %s: %04d-%02d-%02d %02d:%02d:%02d",
                 self.device_name or "Unknown Device",
@@ -793,37 +879,13 @@ class EnstoThermostatManager:
                 year, month, day, hour, minute, second
             )
 
-            # Construct byte array according to device spec 2.2.2:
-            # BYTE[0-1]: year as uint16_t
-            # BYTE[2]: month 1-12
-            # BYTE[3]: date 1-31
-            # BYTE[4]: hour 0-23
-            # BYTE[5]: minute 0-59
-            # BYTE[6]: second 0-59
-            year_bytes = year.to_bytes(2, byteorder="little")
-            data = bytearray([
-                year_bytes[0],    # First byte of year
-                year_bytes[1],    # Second byte of year
-                month,            # Month
-                day,              # Day
-                hour,             # Hour
-                minute,           # Minute
-                second            # Second
-            ])
-
-            # Write to device
-            await self.client.write_gatt_char(DATE_AND_TIME_UUID, data, response=True)
-            return True
+        data = self._pack_date_and_time(year, month, day, hour, minute, second)
 
-        except BleakError as e:
-            _LOGGER.error("BLE error writing UTC time to device: %s", e)
-            self.client = None
-            return None
-        
-        except Exception as e:
-            _LOGGER.error("Failed to write UTC time to device: %s", e)
-            return False
+        # Write to device
+        await self.client.write_gatt_char(self.get_characteristic(DATE_AND_TIME_UUID), data, response=True)
+        return True
 
+    @_ble_op("read daylight saving config", None)
     async def read_daylight_saving(self) -> dict:
         """Read daylight saving configuration from device.
         
@@ -835,39 +897,23 @@ class EnstoThermostatManager:
                 timezone_offset (int): Base timezone offset in minutes from UTC
             None: If read fails
         """
-        try:
-            if not self.client or not self.client.is_connected:
-                _LOGGER.error("Device not connected.")
-                return None
-
-            # Read raw data from device
-            data = await self.client.read_gatt_char(DAYLIGHT_SAVING_UUID)
-
-            # Parse data
-            enabled = bool(data[0])
-            # bytes 2-3: winter->summer offset (signed int16)
-            winter_to_summer = int.from_bytes(data[2:4], byteorder='little', signed=True)
-            # bytes 4-5: summer->winter offset (signed int16)
-            summer_to_winter = int.from_bytes(data[4:6], byteorder='little', signed=True)
-            # bytes 6-7: timezone offset in minutes (signed int16)
-            timezone_offset = int.from_bytes(data[6:8], byteorder='little', signed=True)
-
-            return {
-                'enabled': enabled,
-                'winter_to_summer_offset': winter_to_summer,
-                'summer_to_winter_offset': summer_to_winter,
-                'timezone_offset': timezone_offset
-            }
-
-        except BleakError as e:
-            _LOGGER.error("BLE error reading daylight saving config: %s", e)
-            self.client = None
-            return None
-        
-        except Exception as e:
-            _LOGGER.error("Failed to read daylight saving config: %s", e)
-            return None
-
+        # Read raw data from device
+        data = await self.client.read_gatt_char(self.get_characteristic(DAYLIGHT_SAVING_UUID))
+
+        # Parse data: enabled flag, reserved byte, then winter->summer,
+        # summer->winter and timezone offsets in minutes (signed int16)
+        enabled, winter_to_summer, summer_to_winter, timezone_offset = DAYLIGHT_SAVING_STRUCT.unpack_from(data)
+        enabled = bool(enabled)
+        self.dst_enabled = enabled
+
+        return {
+            'enabled': enabled,
+            'winter_to_summer_offset': winter_to_summer,
+            'summer_to_winter_offset': summer_to_winter,
+            'timezone_offset': timezone_offset
+        }
+
+    @_ble_op("write daylight saving config", False)
     async def write_daylight_saving(
         self,
         enabled: bool,
@@ -892,42 +938,158 @@ class EnstoThermostatManager:
             - DST changes are 1h (60 minutes)
             - Device adds the DST offset automatically when enabled
         """
-        try:
-            if not self.client or not self.client.is_connected:
-                _LOGGER.error("Device not connected.")
-                return False
-
-            data = bytearray(8)
-            data[0] = 1 if enabled else 0  # Enable/disable flag
-            data[1] = 0  # Reserved byte
-            
-            # Winter->summer offset (1h = 60 minutes)
-            data[2:4] = winter_to_summer.to_bytes(2, byteorder='little', signed=True)
-            
-            # Summer->winter offset (1h = 60 minutes)
-            data[4:6] = summer_to_winter.to_bytes(2, byteorder='little', signed=True)
-            
-            # Timezone offset (UTC+2 = 120 minutes for Finland)
-            data[6:8] = timezone_offset.to_bytes(2, byteorder='little', signed=True)
+        data = self._pack_daylight_saving(enabled, winter_to_summer, summer_to_winter, timezone_offset)
 
-            await self.client.write_gatt_char(DAYLIGHT_SAVING_UUID, data, response=True)
+        try:
+            await self.client.write_gatt_char(self.get_characteristic(DAYLIGHT_SAVING_UUID), data, response=True)
+        except Exception:
+            # The device state is unknown after a failed write
+            self.dst_enabled = None
+            raise
+        self.dst_enabled = enabled
+        if _LOGGER.isEnabledFor(logging.DEBUG):
             _LOGGER.debug(
                 "Wrote DST config to %s for %s: enabled=%s, timezone=%d min",
                 self.device_name or "Unknown Device", 
                 self.mac_address,
                 enabled, timezone_offset
             )
+        return True
+
+    def get_characteristic(self, characteristic_uuid: str) -> BleakGATTCharacteristic | str:
+        """Return the GATT characteristic for a UUID on the current connection.
+
+        Passing the characteristic object to bleak skips its UUID normalization
+        and linear search of the service collection on every read and write.
+        The cache is tied to the client, so a reconnect starts a new one. Falls
+        back to the UUID itself if the characteristic is not resolved.
+        """
+        client = self.client
+        if client is not self._characteristics_client:
+            self._characteristics = {}
+            self._characteristics_client = client
+
+        characteristic = self._characteristics.get(characteristic_uuid)
+        if characteristic is None:
+            try:
+                characteristic = client.services.get_characteristic(characteristic_uuid)
+            except BleakError:
+                characteristic = None
+            if characteristic is None:
+                return characteristic_uuid
+            self._characteristics[characteristic_uuid] = characteristic
+        return characteristic
+
+    def _supports_write_without_response(self, characteristic_uuid: str) -> bool:
+        """Return True if the characteristic advertises write without response."""
+        characteristic = self.get_characteristic(characteristic_uuid)
+        return not isinstance(characteristic, str) and "write-without-response" in characteristic.properties
+
+    def _write_needs_response(self, characteristic_uuid: str) -> bool:
+        """Return True unless the write may go unacknowledged.
+
+        Only characteristics in _FIRE_AND_FORGET_UUIDS that also advertise
+        write without response skip the acknowledgement.
+        """
+        return (characteristic_uuid not in _FIRE_AND_FORGET_UUIDS or
+                not self._supports_write_without_response(characteristic_uuid))
+
+    @staticmethod
+    def _pack_date_and_time(year: int, month: int, day: int, hour: int, minute: int, second: int) -> bytes:
+        """Build date and time payload according to device spec 2.2.2.
+
+        BYTE[0-1]: year as uint16_t
+        BYTE[2]: month 1-12
+        BYTE[3]: date 1-31
+        BYTE[4]: hour 0-23
+        BYTE[5]: minute 0-59
+        BYTE[6]: second 0-59
+        """
+        return DATE_AND_TIME_STRUCT.pack(year, month, day, hour, minute, second)
+
+    @staticmethod
+    def _pack_daylight_saving(
+        enabled: bool,
+        winter_to_summer: int,
+        summer_to_winter: int,
+        timezone_offset: int
+    ) -> bytes:
+        """Build daylight saving payload according to device spec 2.2.3.
+
+        Enable flag and reserved byte, then winter->summer and summer->winter
+        offsets (1h = 60 minutes) and the timezone offset (UTC+2 = 120 minutes
+        for Finland), all in minutes.
+        """
+        return DAYLIGHT_SAVING_STRUCT.pack(
+            1 if enabled else 0, winter_to_summer, summer_to_winter, timezone_offset
+        )
+
+    async def write_time_and_dst(
+        self,
+        utc_time: datetime,
+        dst_enabled: bool,
+        winter_to_summer: int,
+        summer_to_winter: int,
+        timezone_offset: int
+    ) -> bool:
+        """Write UTC date and time followed by daylight saving configuration.
+
+        Both payloads are built before the first write, so the two GATT writes
+        are issued back to back. The date and time write skips the
+        acknowledgement when the characteristic advertises write without
+        response; the daylight saving write is always acknowledged and
+        confirms the sequence.
+
+        Args:
+            utc_time: Current time in UTC
+            dst_enabled: Enable/disable daylight saving
+            winter_to_summer: Offset in minutes for winter to summer transition
+            summer_to_winter: Offset in minutes for summer to winter transition
+            timezone_offset: Base timezone offset in minutes
+
+        Returns:
+            bool: True if both writes succeeded, False if failed
+        """
+        try:
+            if self.client is None:
+                _LOGGER.error("Device not connected.")
+                return False
+
+            time_data = self._pack_date_and_time(
+                utc_time.year, utc_time.month, utc_time.day,
+                utc_time.hour, utc_time.minute, utc_time.second
+            )
+            dst_data = self._pack_daylight_saving(dst_enabled, winter_to_summer, summer_to_winter, timezone_offset)
+
+            await self.client.write_gatt_char(
+                self.get_characteristic(DATE_AND_TIME_UUID),
+                time_data,
+                response=not self._supports_write_without_response(DATE_AND_TIME_UUID)
+            )
+            await self.client.write_gatt_char(self.get_characteristic(DAYLIGHT_SAVING_UUID), dst_data, response=True)
+            self.dst_enabled = dst_enabled
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Wrote UTC time %s and DST config to %s for %s: enabled=%s, timezone=%d min",
+                    utc_time.strftime('%Y-%m-%d %H:%M:%S'),
+                    self.device_name or "Unknown Device",
+                    self.mac_address,
+                    dst_enabled, timezone_offset
+                )
             return True
 
         except BleakError as e:
-            _LOGGER.error("BLE error writing daylight saving config: %s", e)
+            _LOGGER.error("BLE error writing time and daylight saving config: %s", e)
             self.client = None
-            return None
-        
+            self.dst_enabled = None
+            return False
+
         except Exception as e:
-            _LOGGER.error("Failed to write daylight saving config: %s", e)
+            _LOGGER.error("Failed to write time and daylight saving config: %s", e)
+            self.dst_enabled = None
             return False
 
+    @_ble_op("read floor limits", None)
     async def read_floor_limits(self) -> Optional[dict]:
         """Read floor temperature limits from device.
              
@@ -937,25 +1099,17 @@ class EnstoThermostatManager:
                 high_value: Max floor temp in °C (range 13-50)
             None if read fails
         """
-        try:
-            data = await self.client.read_gatt_char(FLOOR_LIMITS_UUID)
-            if not data or len(data) != 4:
-                return None
-                   
-            return {
-                'low_value': int.from_bytes(data[0:2], byteorder='little') / 100,
-                'high_value': int.from_bytes(data[2:4], byteorder='little') / 100
-            }
-
-        except BleakError as e:
-            _LOGGER.error("BLE error reading floor limits: %s", e)
-            self.client = None
-            return None
-        
-        except Exception as e:
-            _LOGGER.error("Failed to read floor limits: %s", e)
+        data = await self.client.read_gatt_char(self.get_characteristic(FLOOR_LIMITS_UUID))
+        if not data or len(data) != 4:
             return None
+               
+        low_raw, high_raw = FLOOR_LIMITS_STRUCT.unpack(data)
+        return {
+            'low_value': low_raw / 100,
+            'high_value': high_raw / 100
+        }
 
+    @_ble_op("write floor limits", False)
     async def write_floor_limits(self, low_value: float, high_value: float) -> bool:
         """Write floor temperature limits to device.
 
@@ -972,133 +1126,72 @@ class EnstoThermostatManager:
             - Min absolute value: 5°C
             - Max absolute value: 50°C
         """
-        try:
-            # Input validation
-            if not (5 <= low_value <= 42):
-                _LOGGER.error("Min floor temp must be between 5-42°C")
-                return False
-                  
-            if not (13 <= high_value <= 50):
-                _LOGGER.error("Max floor temp must be between 13-50°C")
-                return False
-                  
-            if high_value - low_value < 8:
-                _LOGGER.error("Min must be at least 8°C lower than max")
-                return False
-                   
-            data = bytearray(4)
-            low_raw = int(low_value * 100)
-            high_raw = int(high_value * 100)
-            data[0:2] = low_raw.to_bytes(2, byteorder='little')
-            data[2:4] = high_raw.to_bytes(2, byteorder='little')
-               
-            await self.client.write_gatt_char(FLOOR_LIMITS_UUID, data)
-            _LOGGER.debug(
-                "Floor limits written successfully: min=%.1f °C, max=%.1f °C",
-                low_value,
-                high_value
-            )
-            return True
-
-        except BleakError as e:
-            _LOGGER.error("BLE error writing floor limits: %s", e)
-            self.client = None
-            return None
-        
-        except Exception as e:
-            _LOGGER.error("Failed to write floor limits: %s", e)
+        # Input validation
+        if not (5 <= low_value <= 42):
+            _LOGGER.error("Min floor temp must be between 5-42°C")
             return False
-
+              
+        if not (13 <= high_value <= 50):
+            _LOGGER.error("Max floor temp must be between 13-50°C")
+            return False
+              
+        if high_value - low_value < 8:
+            _LOGGER.error("Min must be at least 8°C lower than max")
+            return False
+               
+        data = FLOOR_LIMITS_STRUCT.pack(int(low_value * 100), int(high_value * 100))
+           
+        await self.client.write_gatt_char(self.get_characteristic(FLOOR_LIMITS_UUID), data, response=True)
+        _LOGGER.debug(
+            "Floor limits written successfully: min=%.1f °C, max=%.1f °C",
+            low_value,
+            high_value
+        )
+        return True
+
+    @_ble_op("read room sensor calibration", None)
     async def read_room_sensor_calibration(self) -> dict:
         """Read room sensor calibration value."""
-        try:
-            if not self.client or not self.client.is_connected:
-                _LOGGER.error("Device not connected.")
-                return None
-                
-            data = await self.client.read_gatt_char(CALIBRATION_VALUE_FOR_ROOM_TEMPERATURE_UUID)
-            raw_value = int.from_bytes(data[0:2], byteorder='little', signed=True)
-            calibration_value = round(raw_value / 10, 1)
-            
-            return {
-                'calibration_value': calibration_value
-            }
-
-        except BleakError as e:
-            _LOGGER.error("BLE error reading room sensor calibration: %s", e)
-            self.client = None
-            return None
+        data = await self.client.read_gatt_char(self.get_characteristic(CALIBRATION_VALUE_FOR_ROOM_TEMPERATURE_UUID))
+        raw_value, = CALIBRATION_VALUE_STRUCT.unpack_from(data)
+        calibration_value = round(raw_value / 10, 1)
         
-        except Exception as e:
-            _LOGGER.error("Failed to read room sensor calibration: %s", e)
-            return None
+        return {
+            'calibration_value': calibration_value
+        }
 
+    @_ble_op("write room sensor calibration", False)
     async def write_room_sensor_calibration(self, value: float) -> bool:
         """Write room sensor calibration value."""
-        try:
-            if not self.client or not self.client.is_connected:
-                _LOGGER.error("Device not connected.")
-                return False
-                
-            if not (-5.0 <= value <= 5.0):
-                raise ValueError("Calibration value must be between -5.0 and +5.0 °C")
-                
-            raw_value = int(value * 10)
-            data = raw_value.to_bytes(2, byteorder='little', signed=True)
-            
-            await self.client.write_gatt_char(
-                CALIBRATION_VALUE_FOR_ROOM_TEMPERATURE_UUID,
-                data,
-                response=True
-            )
+        if not (-5.0 <= value <= 5.0):
+            raise ValueError("Calibration value must be between -5.0 and +5.0 °C")
             
-            return True
-                
-        except BleakError as e:
-            _LOGGER.error("BLE error writing room sensor calibration: %s", e)
-            self.client = None
-            return None
+        raw_value = int(value * 10)
+        data = CALIBRATION_VALUE_STRUCT.pack(raw_value)
         
-        except Exception as e:
-            _LOGGER.error("Failed to write room sensor calibration: %s", e)
-            return False
+        await self.client.write_gatt_char(
+            self.get_characteristic(CALIBRATION_VALUE_FOR_ROOM_TEMPERATURE_UUID),
+            data,
+            response=True
+        )
+        
+        return True
 
+    @_ble_op("read software revision", None, log_disconnected=False)
     async def read_software_revision(self) -> Optional[str]:
         """Read software revision string."""
-        try:
-            if not self.client or not self.client.is_connected:
-                return None
-            data = await self.client.read_gatt_char(SOFTWARE_REVISION_UUID)
-            # Parse format: app;ble;bootloader
-            return data.decode('utf-8')
-
-        except BleakError as e:
-            _LOGGER.error("BLE error reading software revision: %s", e)
-            self.client = None
-            return None
-        
-        except Exception as e:
-            _LOGGER.error("Failed to read software revision: %s", e)
-            return None
+        data = await self.client.read_gatt_char(self.get_characteristic(SOFTWARE_REVISION_UUID))
+        # Parse format: app;ble;bootloader
+        return data.decode('utf-8')
 
+    @_ble_op("read hardware revision", None, log_disconnected=False)
     async def read_hardware_revision(self) -> Optional[str]:
         """Read hardware revision."""
-        try:
-            if not self.client or not self.client.is_connected:
-                return None
-            data = await self.client.read_gatt_char(HARDWARE_REVISION_UUID)
-            hw_version = int.from_bytes(data[0:4], byteorder='little')
-            return str(hw_version)
-
-        except BleakError as e:
-            _LOGGER.error("BLE error reading hardware revision: %s", e)
-            self.client = None
-            return None
-
-        except Exception as e:
-            _LOGGER.error("Failed to read hardware revision: %s", e)
-            return None
+        data = await self.client.read_gatt_char(self.get_characteristic(HARDWARE_REVISION_UUID))
+        hw_version, = HARDWARE_REVISION_STRUCT.unpack_from(data)
+        return str(hw_version)
 
+    @_ble_op("read custom heating power value", None)
     async def read_heating_power(self) -> dict:
         """Read custom heating power configuration from device.
         
@@ -1107,29 +1200,16 @@ class EnstoThermostatManager:
                 heating_power (int): Heating power in Watts (range 0-9999)
         """
 
-        try:
-            if not self.client or not self.client.is_connected:
-                _LOGGER.error("Device not connected.")
-                return None
-
-            # Read raw data from device
-            data = await self.client.read_gatt_char(HEATING_POWER_UUID)
-            
-            heating_power = int.from_bytes(data[0:2], byteorder='little')
-
-            return {
-                'heating_power': heating_power
-            }
-
-        except BleakError as e:
-            _LOGGER.error("BLE error reading custom heating power value: %s", e)
-            self.client = None
-            return None
+        # Read raw data from device
+        data = await self.client.read_gatt_char(self.get_characteristic(HEATING_POWER_UUID))
+        
+        heating_power, = HEATING_POWER_STRUCT.unpack_from(data)
 
-        except Exception as e:
-            _LOGGER.error("Failed to read custom heating power value: %s", e)
-            return None
+        return {
+            'heating_power': heating_power
+        }
 
+    @_ble_op("write custom heating power value", False)
     async def write_heating_power(self, value: int) -> bool:
         """Write custom heating power configuration to device.
         
@@ -1144,26 +1224,17 @@ class EnstoThermostatManager:
             _LOGGER.error("Heating power value must be between 0 and 9999")
             return False
 
-        try:
-            if not self.client or not self.client.is_connected:
-                _LOGGER.error("Device not connected.")
-                return False
-                
-            data = value.to_bytes(2, byteorder='little')
-            
-            await self.client.write_gatt_char(HEATING_POWER_UUID, data, response=True)
-
-            return True
-
-        except BleakError as e:
-            _LOGGER.error("BLE error writing custom heating power value: %s", e)
-            self.client = None
-            return None
+        data = HEATING_POWER_STRUCT.pack(value)
+        
+        await self.client.write_gatt_char(
+            self.get_characteristic(HEATING_POWER_UUID),
+            data,
+            response=self._write_needs_response(HEATING_POWER_UUID)
+        )
 
-        except Exception as e:
-            _LOGGER.error("Failed to write custom heating power value: %s", e)
-            return False
+        return True
 
+    @_ble_op("read custom floor area value", None)
     async def read_floor_area(self) -> dict:
         """Read custom floor area configuration from device.
         
@@ -1172,29 +1243,16 @@ class EnstoThermostatManager:
                 floor_area (int): Floor area in square meters (m²)
         """
             
-        try:
-            if not self.client or not self.client.is_connected:
-                _LOGGER.error("Device not connected.")
-                return None
-
-            # Read raw data from device
-            data = await self.client.read_gatt_char(FLOOR_AREA_UUID)
-            
-            floor_area = int.from_bytes(data[0:2], byteorder='little')
-
-            return {
-                'floor_area': floor_area
-            }
-
-        except BleakError as e:
-            _LOGGER.error("BLE error reading custom floor area value: %s", e)
-            self.client = None
-            return None
+        # Read raw data from device
+        data = await self.client.read_gatt_char(self.get_characteristic(FLOOR_AREA_UUID))
+        
+        floor_area, = FLOOR_AREA_STRUCT.unpack_from(data)
 
-        except Exception as e:
-            _LOGGER.error("Failed to read custom floor area value: %s", e)
-            return None
+        return {
+            'floor_area': floor_area
+        }
 
+    @_ble_op("write custom floor area value", False)
     async def write_floor_area(self, value: int) -> bool:
         """Write custom floor area configuration to device.
         
@@ -1212,26 +1270,17 @@ class EnstoThermostatManager:
             _LOGGER.error("Floor area value must be between 0 and 65535 for uint16_t")
             return False
 
-        try:
-            if not self.client or not self.client.is_connected:
-                _LOGGER.error("Device not connected.")
-                return False
-                
-            data = value.to_bytes(2, byteorder='little')
-            
-            await self.client.write_gatt_char(FLOOR_AREA_UUID, data, response=True)
-
-            return True
-
-        except BleakError as e:
-            _LOGGER.error("BLE error writing custom floor area value: %s", e)
-            self.client = None
-            return None
+        data = FLOOR_AREA_STRUCT.pack(value)
         
-        except Exception as e:
-            _LOGGER.error("Failed to write custom floor area value: %s", e)
-            return False
+        await self.client.write_gatt_char(
+            self.get_characteristic(FLOOR_AREA_UUID),
+            data,
+            response=self._write_needs_response(FLOOR_AREA_UUID)
+        )
+
+        return True
 
+    @_ble_op("read energy unit configuration", None)
     async def read_energy_unit(self) -> dict:
         """Read energy unit configuration from device.
         
@@ -1251,76 +1300,45 @@ class EnstoThermostatManager:
             }
         """
 
-        try:
-            if not self.client or not self.client.is_connected:
-                _LOGGER.error("Device not connected.")
-                return None
-
-            # Read raw data from device
-            data = await self.client.read_gatt_char(ENERGY_UNIT_UUID)
-            
-            # Parse currency (first byte)
-            currency = data[0]
-            
-            # Parse price (bytes 2-3 as unsigned int16, scaled by 100)
-            price_raw = int.from_bytes(data[2:4], byteorder='little')
-            price = price_raw / 100.0
-
-            return {
-                'currency_code': currency,
-                'currency_name': CURRENCY_MAP.get(currency, "Unknown"),
-                'currency_symbol': CURRENCY_SYMBOLS.get(currency, ""),
-                'price': price
-            }
+        # Read raw data from device
+        data = await self.client.read_gatt_char(self.get_characteristic(ENERGY_UNIT_UUID))
         
-        except BleakError as e:
-            _LOGGER.error("BLE error reading energy unit configuratio: %s", e)
-            self.client = None
-            return None
-
-        except Exception as e:
-            _LOGGER.error("Failed to read energy unit configuration: %s", e)
-            return None
-
+        # Parse currency (first byte) and price (bytes 2-3 as unsigned int16, scaled by 100)
+        currency, price_raw = ENERGY_UNIT_STRUCT.unpack_from(data)
+        price = price_raw / 100.0
+
+        return {
+            'currency_code': currency,
+            'currency_name': CURRENCY_NAME_BY_CODE[currency],
+            'currency_symbol': CURRENCY_SYMBOL_BY_CODE[currency],
+            'price': price
+        }
+
+    @_ble_op("write energy unit configuration", False)
     async def write_energy_unit(self, currency: int, price: float) -> bool:
         """Write energy unit configuration to device."""
 
-        try:
-            if not self.client or not self.client.is_connected:
-                _LOGGER.error("Device not connected.")
-                return False
-            
-            if not (0 <= price <= 655.35):
-                _LOGGER.error("Price must be between 0 and 655.35: %s", price)
-                return False
-
-            # Prepare data packet
-            data = bytearray(4)
-            data[0] = currency  # Currency code
-            data[1] = 0  # Unused byte
+        if not (0 <= price <= 655.35):
+            _LOGGER.error("Price must be between 0 and 655.35: %s", price)
+            return False
 
-            # Convert price to integer scaled by 100
-            price_raw = int(price * 100)
-            data[2:4] = price_raw.to_bytes(2, byteorder='little')
+        # Prepare data packet: currency code, unused byte, price scaled by 100
+        data = ENERGY_UNIT_STRUCT.pack(currency, int(price * 100))
 
-            # Write to device
-            await self.client.write_gatt_char(ENERGY_UNIT_UUID, data, response=True)
-            
+        # Write to device
+        await self.client.write_gatt_char(
+            self.get_characteristic(ENERGY_UNIT_UUID),
+            data,
+            response=self._write_needs_response(ENERGY_UNIT_UUID)
+        )
+        
+        if _LOGGER.isEnabledFor(logging.DEBUG):
             _LOGGER.debug(
                 "Wrote energy unit config for %s (%s) - Currency: %s (%d), Price: %.2f",
                 self.device_name, self.mac_address,
                 CURRENCY_MAP.get(currency, "Unknown"), currency, price
             )
-            return True
-
-        except BleakError as e:
-            _LOGGER.error("BLE error writing energy unit configuration: %s", e)
-            self.client = None
-            return None
-
-        except Exception as e:
-            _LOGGER.error("Failed to write energy unit configuration: %s", e)
-            return False
+        return True
 
     async def read_power_consumption(self) -> dict:
         """Read real time power consumption data.
@@ -1349,26 +1367,23 @@ class EnstoThermostatManager:
             month = data[2] # uint8 month
             year = data[3]  # uint8 year (0-255)
 
-            measurements = []
+            # All measurements are relative to the header hour
+            timestamp = datetime(2000 + year, month, day, hour, tzinfo=dt_util.UTC)
 
-            # Process measurement pairs (delta hour and ratio)
-            for i in range(24):  # 25 hours of data
-                offset = 4 + i * 2  # Start after header, 2 bytes per measurement
-                delta_hours = data[offset]
-                ratio = data[offset + 1]
-                
-                # Skip invalid values (0xff)
-                if ratio == 0xff:
-                    continue
-                    
-                # Calculate timestamp for this measurement
-                timestamp = datetime(2000 + year, month, day, hour, tzinfo=dt_util.UTC) - timedelta(hours=delta_hours)
-                
-                measurements.append({
-                    'timestamp': timestamp,
+            # Process measurement pairs (delta hour and ratio), 24 hours of data
+            count = min(24, (len(data) - 4) // MONITORING_RATIO_STRUCT.size)
+            records = MONITORING_RATIO_STRUCT.iter_unpack(memoryview(data)[4:4 + count * MONITORING_RATIO_STRUCT.size])
+
+            # Skip invalid values (0xff)
+            measurements = [
+                {
+                    'timestamp': timestamp - _HOUR_OFFSETS[delta_hours],
                     'ratio': ratio
-                })
-            
+                }
+                for delta_hours, ratio in records
+                if ratio != 0xff
+            ]
+
             return {
                 'timestamp': timestamp,
                 'measurements': measurements
@@ -1405,6 +1420,9 @@ class EnstoThermostatManager:
                 'temperature_history': []
             }
 
+            # Records are unpacked from views of the buffer, without copying it
+            view = memoryview(data)
+
             # Current position in data array
             pos = 0
 
@@ -1419,22 +1437,27 @@ class EnstoThermostatManager:
                 pos += 3
 
                 # Process 7 days of power data
-                for _ in range(7):
-                    if len(data) >= pos + 2:
-                        delta_days = data[pos]
-                        ratio_raw = data[pos + 1]
-                        
-                        timestamp = datetime(2000 + year, month, day, tzinfo=dt_util.UTC) - timedelta(days=delta_days)
-                        
-                        # Convert raw value to ratio, using None for unset values (0xff)
-                        ratio = None if ratio_raw == 0xff else ratio_raw
+                count = min(7, (len(data) - pos) // MONITORING_RATIO_STRUCT.size)
+                records = MONITORING_RATIO_STRUCT.iter_unpack(
+                    view[pos:pos + count * MONITORING_RATIO_STRUCT.size]
+                )
+
+                # All days are relative to the header day
+                if count:
+                    base_time = datetime(2000 + year, month, day, tzinfo=dt_util.UTC)
+
+                for delta_days, ratio in records:
+                    # Skip unset values (0xff) before building their timestamp
+                    if ratio == 0xff:
+                        continue
 
-                        # Store the values in result
-                        result['daily_power'].append({
-                            'time': timestamp.isoformat(),
-                            'ratio': ratio
-                        })
-                        pos += 2
+                    timestamp = base_time - _DAY_OFFSETS[delta_days]
+
+                    # Store the values in result
+                    result['daily_power'].append({
+                        'time': timestamp.isoformat(),
+                        'ratio': ratio
+                    })
 
             # Parse last 12 month power data
             # Offset calculation: daily data uses 19 bytes, so monthly starts at 19
@@ -1449,23 +1472,28 @@ class EnstoThermostatManager:
                    pos += 2
 
                    # Process 12 months of power data
-                   for _ in range(12):
-                       if len(data) >= pos + 2:
-                           delta_months = data[pos]
-                           ratio_raw = data[pos + 1]
-
-                           # Calculate timestamp using relativedelta for accurate month subtraction
-                           timestamp = datetime(2000 + year, month, 1, tzinfo=dt_util.UTC) - relativedelta(months=delta_months)
-                           
-                           # Convert raw value to ratio, using None for unset values (0xff)
-                           ratio = None if ratio_raw == 0xff else ratio_raw
-
-                           # Store the values in result
-                           result['monthly_power'].append({
-                               'time': timestamp.isoformat(),
-                               'ratio': ratio
-                           })
-                           pos += 2
+                   count = min(12, (len(data) - pos) // MONITORING_RATIO_STRUCT.size)
+                   records = MONITORING_RATIO_STRUCT.iter_unpack(
+                       view[pos:pos + count * MONITORING_RATIO_STRUCT.size]
+                   )
+
+                   # All months are relative to the header month
+                   if count:
+                       base_time = datetime(2000 + year, month, 1, tzinfo=dt_util.UTC)
+
+                   for delta_months, ratio in records:
+                       # Skip unset values (0xff) before building their timestamp
+                       if ratio == 0xff:
+                           continue
+
+                       # Calculate timestamp using relativedelta for accurate month subtraction
+                       timestamp = base_time - _MONTH_OFFSETS[delta_months]
+
+                       # Store the values in result
+                       result['monthly_power'].append({
+                           'time': timestamp.isoformat(),
+                           'ratio': ratio
+                       })
 
             # Parse temperature history (24 hours * 7 days)
             if len(data) >= 47:  # 19 (daily) + 28 (monthly) bytes minimum before temperature data
@@ -1481,28 +1509,33 @@ class EnstoThermostatManager:
 
                    # Process 168 hours (24*7) of temperature data
                    # Data per hour: delta_hour(1) + floor_temp(2) + room_temp(2) = 5 bytes
-                   for _ in range(168):
-                       if len(data) >= pos + 5:
-                           delta_hours = data[pos]
-                           
-                           # Get raw temperature values from bytes
-                           floor_temp_raw = int.from_bytes(data[pos+1:pos+3], byteorder='little', signed=True)
-                           room_temp_raw = int.from_bytes(data[pos+3:pos+5], byteorder='little', signed=True)
-
-                           # Calculate timestamp for this measurement
-                           timestamp = datetime(2000 + year, month, min(max(1, day), 28), hour, tzinfo=dt_util.UTC) - timedelta(hours=delta_hours)
-
-                           # Convert raw values to temperatures, using None for unset values (0x7fff)
-                           floor_temp = None if floor_temp_raw == 0x7fff else floor_temp_raw / 10
-                           room_temp = None if room_temp_raw == 0x7fff else room_temp_raw / 10
-                           
-                           # Store the values in result
-                           result['temperature_history'].append({
-                               'time': timestamp.isoformat(),
-                               'floor_temp': floor_temp,
-                               'room_temp': room_temp,
-                           })
-                           pos += 5
+                   count = min(168, (len(data) - pos) // MONITORING_HOURLY_STRUCT.size)
+                   records = MONITORING_HOURLY_STRUCT.iter_unpack(
+                       view[pos:pos + count * MONITORING_HOURLY_STRUCT.size]
+                   )
+
+                   # All measurements are relative to the header hour
+                   if count:
+                       base_time = datetime(2000 + year, month, min(max(1, day), 28), hour, tzinfo=dt_util.UTC)
+
+                   for delta_hours, floor_temp_raw, room_temp_raw in records:
+                       # Skip hours with neither temperature set (0x7fff)
+                       if floor_temp_raw == 0x7fff and room_temp_raw == 0x7fff:
+                           continue
+
+                       # Calculate timestamp for this measurement
+                       timestamp = base_time - _HOUR_OFFSETS[delta_hours]
+
+                       # Convert raw values to temperatures, using None for unset values (0x7fff)
+                       floor_temp = None if floor_temp_raw == 0x7fff else floor_temp_raw / 10
+                       room_temp = None if room_temp_raw == 0x7fff else room_temp_raw / 10
+
+                       # Store the values in result
+                       result['temperature_history'].append({
+                           'time': timestamp.isoformat(),
+                           'floor_temp': floor_temp,
+                           'room_temp': room_temp,
+                       })
 
             return result
 
@@ -1516,49 +1549,42 @@ class EnstoThermostatManager:
             return None
 
     async def read_vacation_time(self) -> Optional[dict]:
-        """Read vacation time configuration from device."""
+        """Read vacation time configuration from device.
+
+        The parsed settings are reused for VACATION_CACHE_SECONDS, so the
+        vacation entities polling together share one read. Writes, disconnects
+        and reconnects invalidate it.
+        """
+        if (self._vacation_cache is not None and
+                self.hass.loop.time() - self._vacation_cache_time < VACATION_CACHE_SECONDS):
+            return self._vacation_cache
+
         try:
-            data = await self.client.read_gatt_char(VACATION_TIME_UUID)
+            data = await self.client.read_gatt_char(self.get_characteristic(VACATION_TIME_UUID))
             
             if not data or len(data) < 15:
                 _LOGGER.error("Invalid vacation time data length")
                 return None
 
-            # Parse wall clock time from device
-            from_year = 2000 + data[0]
-            from_month = data[1]
-            from_day = data[2]
-            from_hour = data[3]
-            from_minute = data[4]
-            
-            # Create wall clock time as naive datetime
-            time_from_naive = datetime(from_year, from_month, from_day, from_hour, from_minute)
-            # Assume it's local time and convert to UTC for Home Assistant
-            time_from = dt_util.as_utc(dt_util.as_local(time_from_naive))
-            
-            # Parse time to wall clock time
-            to_year = 2000 + data[5]
-            to_month = data[6]
-            to_day = data[7]
-            to_hour = data[8]
-            to_minute = data[9]
-            
-            # Create wall clock time as naive datetime
-            time_to_naive = datetime(to_year, to_month, to_day, to_hour, to_minute)
-            # Assume it's local time and convert to UTC for Home Assistant
-            time_to = dt_util.as_utc(dt_util.as_local(time_to_naive))
+            (from_year, from_month, from_day, from_hour, from_minute,
+             to_year, to_month, to_day, to_hour, to_minute,
+             offset_temp_raw, offset_percentage, enabled, active) = VACATION_TIME_STRUCT.unpack_from(data)
+
+            # Wall clock times are in the local time zone, convert to UTC for Home Assistant
+            ha_tz = dt_util.DEFAULT_TIME_ZONE
+            time_from = datetime(
+                2000 + from_year, from_month, from_day, from_hour, from_minute, tzinfo=ha_tz
+            ).astimezone(dt_util.UTC)
+            time_to = datetime(
+                2000 + to_year, to_month, to_day, to_hour, to_minute, tzinfo=ha_tz
+            ).astimezone(dt_util.UTC)
 
-            # Parse temperature offset
-            offset_temp_raw = int.from_bytes(data[10:12], byteorder='little', signed=True)
+            # Temperature offset is scaled by 100, percentage offset is a signed byte
             offset_temperature = offset_temp_raw / 100
-            
-            # Parse remaining fields
-            # Convert percentage offset byte to signed int (range -128 to 127)
-            offset_percentage = int.from_bytes([data[12]], byteorder='little', signed=True)
-            enabled = bool(data[13])
-            active = bool(data[14])
+            enabled = bool(enabled)
+            active = bool(active)
 
-            return {
+            self._vacation_cache = {
                 'time_from': time_from,
                 'time_to': time_to,
                 'offset_temperature': offset_temperature,
@@ -1567,10 +1593,13 @@ class EnstoThermostatManager:
                 'active': active,
                 'raw_data': data.hex()  # Include raw data for logging
             }
+            self._vacation_cache_time = self.hass.loop.time()
+            return self._vacation_cache
 
         except BleakError as e:
             _LOGGER.error("BLE error reading vacation time: %s", e)
             self.client = None
+            self._vacation_cache = None
             return None
 
         except Exception as e:
@@ -1593,6 +1622,9 @@ class EnstoThermostatManager:
            offset_temperature (float): Temperature offset in degrees (-20 to +20)
            offset_percentage (int): Percentage offset (-100% to 100%)
            enabled (bool): Enable/disable vacation mode
+
+       Returns:
+           True if successful, False otherwise
        """
        try:
            # Read current settings to preserve active state
@@ -1621,70 +1653,47 @@ class EnstoThermostatManager:
            if not (0 <= to_year <= 255):
                raise ValueError(f"End year must be between 2000-2255, got {local_to.year}")
 
-           # Create data packet
-           data = bytearray(15)
-           
-           # Time from (local wall clock)
-           data[0] = from_year
-           data[1] = local_from.month
-           data[2] = local_from.day
-           data[3] = local_from.hour
-           data[4] = local_from.minute
+           # Create data packet: local wall clock times, offsets, user-set enabled
+           # state and the preserved (read only) active state
+           data = VACATION_TIME_STRUCT.pack(
+               from_year, local_from.month, local_from.day, local_from.hour, local_from.minute,
+               to_year, local_to.month, local_to.day, local_to.hour, local_to.minute,
+               int(offset_temperature * 100),
+               offset_percentage,
+               1 if enabled else 0,
+               1 if current_active else 0,
+           )
            
-           # Time to (local wall clock)
-           data[5] = to_year
-           data[6] = local_to.month
-           data[7] = local_to.day
-           data[8] = local_to.hour
-           data[9] = local_to.minute
-
-           # Temperature offset
-           temp_raw = int(offset_temperature * 100)
-           data[10:12] = temp_raw.to_bytes(2, byteorder='little', signed=True)
-           
-           # Percentage and enabled
-           # Convert percentage offset to signed int8
-           data[12] = offset_percentage.to_bytes(1, byteorder='little', signed=True)[0]
-           data[13] = 1 if enabled else 0  # User-set enabled state - byte 13
-           data[14] = 1 if current_active else 0  # Preserve current active state - byte 14 (read only)
-           
-           await self.client.write_gatt_char(VACATION_TIME_UUID, data)
+           await self.client.write_gatt_char(self.get_characteristic(VACATION_TIME_UUID), data)
            return True
 
        except BleakError as e:
            _LOGGER.error("BLE error writing vacation time: %s", e)
            self.client = None
-           return None
+           return False
 
        except Exception as e:
            _LOGGER.error("Error writing vacation time: %s", e)
            return False
 
+       finally:
+           # The device settings may have changed, read them again next time
+           self._vacation_cache = None
+
+    @_ble_op("read calendar mode", None)
     async def read_calendar_mode(self) -> Optional[dict]:
         """Read calendar mode setting from device.
         
         Returns:
             dict with key 'enabled' (bool) or None if failed
         """
-        try:
-            if not self.client or not self.client.is_connected:
-                _LOGGER.error("Device not connected.")
-                return None
-
-            # Read single byte from device
-            data = await self.client.read_gatt_char(CALENDAR_MODE_UUID)
-            enabled = bool(data[0])
+        # Read single byte from device
+        data = await self.client.read_gatt_char(self.get_characteristic(CALENDAR_MODE_UUID))
+        enabled = bool(data[0])
 
-            return {'enabled': enabled}
-
-        except BleakError as e:
-            _LOGGER.error("BLE error reading calendar mode: %s", e)
-            self.client = None
-            return None
-        except Exception as e:
-            _LOGGER.error("Failed to read calendar mode: %s", e)
-            return None
+        return {'enabled': enabled}
 
+    @_ble_op("write calendar mode", False)
     async def write_calendar_mode(self, enabled: bool) -> bool:
         """Write calendar mode setting to device.
         
@@ -1694,28 +1703,15 @@ class EnstoThermostatManager:
         Returns:
             True if successful, False otherwise
         """
-        try:
-            if not self.client or not self.client.is_connected:
-                _LOGGER.error("Device not connected.")
-                return False
-
-            # Create single byte data
-            data = bytes([1 if enabled else 0])
-            
-            # Write to device
-            await self.client.write_gatt_char(CALENDAR_MODE_UUID, data, response=True)
-            
-            _LOGGER.debug("Action [Calendar Mode %s] for [%s]: success",
-                         "Enable" if enabled else "Disable", self.mac_address)
-            return True
-
-        except BleakError as e:
-            _LOGGER.error("BLE error writing calendar mode: %s", e)
-            self.client = None
-            return False
-        except Exception as e:
-            _LOGGER.error("Failed to write calendar mode: %s", e)
-            return False
+        # Create single byte data
+        data = _BYTE_VALUES[1 if enabled else 0]
+        
+        # Write to device
+        await self.client.write_gatt_char(self.get_characteristic(CALENDAR_MODE_UUID), data, response=True)
+        
+        _LOGGER.debug("Action [Calendar Mode %s] for [%s]: success",
+                     "Enable" if enabled else "Disable", self.mac_address)
+        return True
 
     async def read_calendar_day(self, day: int) -> Optional[dict]:
         """Read calendar day programs from device.
@@ -1727,7 +1723,7 @@ class EnstoThermostatManager:
             dict with 'day' and 'programs' list, or None if failed
         """
         try:
-            if not self.client or not self.client.is_connected:
+            if self.client is None:
                 _LOGGER.error("Device not connected.")
                 return None
                 
@@ -1736,7 +1732,7 @@ class EnstoThermostatManager:
                 return None
 
             # Write day number to control characteristic
-            await self.client.write_gatt_char(CALENDAR_CONTROL_UUID, bytes([day]), response=True)
+            await self.client.write_gatt_char(self.get_characteristic(CALENDAR_CONTROL_UUID), _BYTE_VALUES[day], response=True)
             
             # Add small delay to let device process the request
             await asyncio.sleep(0.2)
@@ -1757,30 +1753,19 @@ class EnstoThermostatManager:
                 programs = []
             elif (len(data) - 1) % 8 == 0:
                 # Valid program data: (length - 1) must be divisible by 8
-                program_count = (len(data) - 1) // 8
                 programs = []
-                
-                # Parse each program
-                for i in range(program_count):
-                    offset = 1 + i * 8  # Start after day byte, 8 bytes per program
-                    
-                    start_hour = data[offset]
-                    start_minute = data[offset + 1]
-                    end_hour = data[offset + 2]
-                    end_minute = data[offset + 3]
-                    temp_offset_raw = int.from_bytes(data[offset + 4:offset + 6], byteorder='little', signed=True)
-                    temp_offset = temp_offset_raw / 100.0  # Convert from device format (200 = 2.0°C)
-                    power_offset = int.from_bytes([data[offset + 6]], byteorder='little', signed=True)
-                    enabled = bool(data[offset + 7])
-                    
+
+                # Parse each program, 8 bytes per program after the day byte
+                for (start_hour, start_minute, end_hour, end_minute,
+                     temp_offset_raw, power_offset, enabled) in CALENDAR_PROGRAM_STRUCT.iter_unpack(memoryview(data)[1:]):
                     program = {
                         'start_hour': start_hour,
                         'start_minute': start_minute,
                         'end_hour': end_hour,
                         'end_minute': end_minute,
-                        'temp_offset': temp_offset,
+                        'temp_offset': temp_offset_raw / 100.0,  # Convert from device format (200 = 2.0°C)
                         'power_offset': power_offset,
-                        'enabled': enabled
+                        'enabled': bool(enabled)
                     }
                     programs.append(program)
 
@@ -1814,7 +1799,7 @@ class EnstoThermostatManager:
             True if successful, False otherwise
         """
         try:
-            if not self.client or not self.client.is_connected:
+            if self.client is None:
                 _LOGGER.error("Device not connected.")
                 return False
                 
@@ -1826,51 +1811,41 @@ class EnstoThermostatManager:
                 _LOGGER.error("Too many programs: %s (max 6)", len(programs))
                 return False
 
-            # Create 49-byte data packet
-            data = bytearray(49)
+            # Create 49-byte data packet, programs not given stay zero (disabled)
+            data = bytearray(1 + 6 * CALENDAR_PROGRAM_STRUCT.size)
             data[0] = day
-            
-            # Fill programs (pad with zeroes if less than 6)
-            for i in range(6):
-                offset = 1 + i * 8
-                
-                if i < len(programs):
-                    program = programs[i]
-                    
-                    # Validate program data
-                    for field in ['start_hour', 'start_minute', 'end_hour', 'end_minute', 'temp_offset', 'power_offset', 'enabled']:
-                        if field not in program:
-                            _LOGGER.error("Missing field '%s' in program %d", field, i)
-                            return False
-                    
-                    data[offset] = program['start_hour']
-                    data[offset + 1] = program['start_minute']
-                    data[offset + 2] = program['end_hour']
-                    data[offset + 3] = program['end_minute']
-                    
-                    # Convert temperature offset to device format (20.5°C = 2050)
-                    temp_raw = int(program['temp_offset'] * 100)
-                    data[offset + 4:offset + 6] = temp_raw.to_bytes(2, byteorder='little', signed=True)
-                    
-                    # Power offset as signed int8
-                    data[offset + 6] = program['power_offset'].to_bytes(1, byteorder='little', signed=True)[0]
-                    data[offset + 7] = 1 if program['enabled'] else 0
-                else:
-                    # Empty program - all zeros (disabled)
-                    for j in range(8):
-                        data[offset + j] = 0
+
+            # Fill programs
+            for i, program in enumerate(programs):
+                # Validate program data
+                for field in ['start_hour', 'start_minute', 'end_hour', 'end_minute', 'temp_offset', 'power_offset', 'enabled']:
+                    if field not in program:
+                        _LOGGER.error("Missing field '%s' in program %d", field, i)
+                        return False
+
+                # Temperature offset in device format (20.5°C = 2050), power offset as signed int8
+                CALENDAR_PROGRAM_STRUCT.pack_into(
+                    data, 1 + i * CALENDAR_PROGRAM_STRUCT.size,
+                    program['start_hour'],
+                    program['start_minute'],
+                    program['end_hour'],
+                    program['end_minute'],
+                    int(program['temp_offset'] * 100),
+                    program['power_offset'],
+                    1 if program['enabled'] else 0,
+                )
 
             # Tell device which day we're writing to
-            await self.client.write_gatt_char(CALENDAR_CONTROL_UUID, bytes([day]), response=True)
+            await self.client.write_gatt_char(self.get_characteristic(CALENDAR_CONTROL_UUID), _BYTE_VALUES[day], response=True)
 
             # Write using split protocol
-            await self.write_split_characteristic(CALENDAR_DAY_UUID, bytes(data))
+            await self.write_split_characteristic(CALENDAR_DAY_UUID, data)
 
             # Add small delay to let device process the request
             await asyncio.sleep(0.2)
             
             # Save to flash (write 0 to control characteristic)
-            await self.client.write_gatt_char(CALENDAR_CONTROL_UUID, bytes([0]), response=True)
+            await self.client.write_gatt_char(self.get_characteristic(CALENDAR_CONTROL_UUID), _BYTE_VALUES[0], response=True)
 
             return True
 
@@ -1904,23 +1879,18 @@ class EnstoThermostatManager:
         try:
             await self.ensure_connection()
 
-            if not self.client or not self.client.is_connected:
+            if self.client is None:
                 _LOGGER.error("Device not connected.")
                 return None
 
-            data = await self.client.read_gatt_char(FORCE_CONTROL_UUID)
+            data = await self.client.read_gatt_char(self.get_characteristic(FORCE_CONTROL_UUID))
             device_name = self.device_name or "Unknown Device"
 
             if len(data) >= 19:
-                # Extended 19-byte format
-                mode = data[17]
-
-                # Mode 5 "Temperature": absolute temperature in byte[8-9]
-                temp_raw = int.from_bytes(data[8:10], byteorder='little')
+                # Extended 19-byte format: mode 5 "Temperature" absolute temperature in
+                # byte[8-9], mode 6 "Temperature change" signed offset in byte[12-13]
+                temp_raw, offset_raw, mode = FORCE_CONTROL_STRUCT.unpack_from(data)
                 temperature = temp_raw / 10.0
-
-                # Mode 6 "Temperature change": offset in byte[12-13] (signed)
-                offset_raw = int.from_bytes(data[12:14], byteorder='little', signed=True)
                 temperature_offset = offset_raw / 10.0
 
                 mode_names = EXTERNAL_CONTROL_MODES
@@ -1987,14 +1957,14 @@ class EnstoThermostatManager:
         try:
             await self.ensure_connection()
 
-            if not self.client or not self.client.is_connected:
+            if self.client is None:
                 _LOGGER.error("Device not connected.")
                 return False
 
             device_name = self.device_name or "Unknown Device"
 
             # Read current values to preserve unchanged settings
-            current = await self.client.read_gatt_char(FORCE_CONTROL_UUID)
+            current = await self.client.read_gatt_char(self.get_characteristic(FORCE_CONTROL_UUID))
             if not current:
                 _LOGGER.error(
                     "Write Force Control %s for %s: could not read current settings",
@@ -2025,7 +1995,7 @@ class EnstoThermostatManager:
             if mode in EXTERNAL_CONTROL_MODES:
                 data[17] = mode
 
-            await self.client.write_gatt_char(FORCE_CONTROL_UUID, data, response=True)
+            await self.client.write_gatt_char(self.get_characteristic(FORCE_CONTROL_UUID), data, response=True)
 
             mode_names = {2: "Off", 5: "Temperature", 6: "Temperature change"}
 
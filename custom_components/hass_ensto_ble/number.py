@@ -1,4 +1,5 @@
 """Support for Ensto BLE number controls."""
+import asyncio
 import logging
 
 from homeassistant.components.number import (
@@ -12,8 +13,7 @@ from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers import device_registry as dr
 
 from .base_entity import EnstoBaseEntity
-from .const import SCAN_INTERVAL, CURRENCY_SYMBOLS
-from .config_flow import CONF_CURRENCY, DEFAULT_CURRENCY
+from .const import SCAN_INTERVAL, CONF_CURRENCY, CURRENCY_SYMBOLS, DEFAULT_CURRENCY
 
 from . import EnstoConfigEntry
 
@@ -145,11 +145,13 @@ class EnstoBoostOffsetNumber(EnstoBaseEntity, NumberEntity):
     async def async_update(self) -> None:
         """Fetch new state data for the number."""
         try:
-            mode_result = await self._manager.read_heating_mode()
+            mode_result, settings = await asyncio.gather(
+                self._manager.read_heating_mode(),
+                self._manager.read_boost(),
+            )
             if mode_result:
                 self._current_mode = mode_result['mode_number']
-            
-            settings = await self._manager.read_boost()
+
             if settings:
                 self._attr_native_value = settings['offset_degrees']
         except Exception as e:
@@ -208,11 +210,13 @@ class EnstoBoostPowerOffsetNumber(EnstoBaseEntity, NumberEntity):
     async def async_update(self) -> None:
         """Fetch new state data for the number."""
         try:
-            mode_result = await self._manager.read_heating_mode()
+            mode_result, settings = await asyncio.gather(
+                self._manager.read_heating_mode(),
+                self._manager.read_boost(),
+            )
             if mode_result:
                 self._current_mode = mode_result['mode_number']
-            
-            settings = await self._manager.read_boost()
+
             if settings:
                 self._attr_native_value = settings['offset_percentage']
         except Exception as e:
@@ -275,11 +279,13 @@ class EnstoFloorLimitNumber(EnstoBaseEntity, NumberEntity):
 
     async def async_update(self) -> None:
             try:
-                mode_result = await self._manager.read_heating_mode()
+                mode_result, limits = await asyncio.gather(
+                    self._manager.read_heating_mode(),
+                    self._manager.read_floor_limits(),
+                )
                 if mode_result:
                     self._current_mode = mode_result['mode_number']
-                    
-                limits = await self._manager.read_floor_limits()
+
                 if limits:
                     self._attr_native_value = limits['low_value' if self._limit_type == "low" else 'high_value']
             except Exception as e:
@@ -496,11 +502,13 @@ class EnstoVacationTempOffsetNumber(EnstoBaseEntity, NumberEntity):
     async def async_update(self) -> None:
         """Fetch new state data for the number."""
         try:
-            mode_result = await self._manager.read_heating_mode()
+            mode_result, result = await asyncio.gather(
+                self._manager.read_heating_mode(),
+                self._manager.read_vacation_time(),
+            )
             if mode_result:
                 self._current_mode = mode_result['mode_number']
-            
-            result = await self._manager.read_vacation_time()
+
             if result:
                 self._attr_native_value = result['offset_temperature']
         except Exception as e:
@@ -556,11 +564,13 @@ class EnstoVacationPowerOffsetNumber(EnstoBaseEntity, NumberEntity):
     async def async_update(self) -> None:
         """Fetch new state data for the number."""
         try:
-            mode_result = await self._manager.read_heating_mode()
+            mode_result, result = await asyncio.gather(
+                self._manager.read_heating_mode(),
+                self._manager.read_vacation_time(),
+            )
             if mode_result:
                 self._current_mode = mode_result['mode_number']
-            
-            result = await self._manager.read_vacation_time()
+
             if result:
                 self._attr_native_value = result['offset_percentage']
         except Exception as e:
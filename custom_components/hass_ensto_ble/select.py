@@ -10,7 +10,7 @@ from homeassistant.helpers import device_registry as dr
 from .base_entity import EnstoBaseEntity
 from .const import (
     SCAN_INTERVAL, FLOOR_SENSOR_TYPE_UUID,
-    FLOOR_SENSOR_CONFIG, MODE_MAP, SUPPORTED_MODES_ECO16, SUPPORTED_MODES_ELTE6,
+    FLOOR_SENSOR_CONFIG, FLOOR_SENSOR_PAYLOAD, FLOOR_SENSOR_STRUCT, MODE_MAP, SUPPORTED_MODES_ECO16, SUPPORTED_MODES_ELTE6,
     EXTERNAL_CONTROL_MODES,
 )
 
@@ -133,23 +133,12 @@ class EnstoFloorSensorSelect(EnstoBaseEntity, SelectEntity):
     async def async_select_option(self, option: str) -> None:
        """Change floor sensor type."""
        try:
-           if option in FLOOR_SENSOR_CONFIG:
-               params = FLOOR_SENSOR_CONFIG[option]
-               
-               # Create new configuration
-               new_config = bytearray(13)
-               new_config[0] = params["sensor_type"]
-               new_config[1:3] = params["sensor_missing_limit"].to_bytes(2, byteorder='little')
-               new_config[3:5] = params["sensor_b_value"].to_bytes(2, byteorder='little')
-               new_config[5:7] = params["pull_up_resistor"].to_bytes(2, byteorder='little')
-               new_config[7:9] = params["sensor_broken_limit"].to_bytes(2, byteorder='little')
-               new_config[9:11] = params["resistance_25c"].to_bytes(2, byteorder='little')
-               new_config[11:13] = params["offset"].to_bytes(2, byteorder='little', signed=True)
-               
+           payload = FLOOR_SENSOR_PAYLOAD.get(option)
+           if payload is not None:
                # Write configuration to device
                await self._manager.client.write_gatt_char(
-                   FLOOR_SENSOR_TYPE_UUID,
-                   new_config,
+                   self._manager.get_characteristic(FLOOR_SENSOR_TYPE_UUID),
+                   payload,
                    response=True
                )
 
@@ -166,14 +155,12 @@ class EnstoFloorSensorSelect(EnstoBaseEntity, SelectEntity):
     async def async_update(self) -> None:
         """Update floor sensor type."""
         try:
-            result = await self._manager.client.read_gatt_char(FLOOR_SENSOR_TYPE_UUID)
+            result = await self._manager.client.read_gatt_char(self._manager.get_characteristic(FLOOR_SENSOR_TYPE_UUID))
             if result:
                 # Parse all values
-                sensor_type = result[0]
-                sensor_missing_limit = int.from_bytes(result[1:3], byteorder='little')
-                sensor_broken_limit = int.from_bytes(result[7:9], byteorder='little')
-                resistance_25c = int.from_bytes(result[9:11], byteorder='little')
-                offset = int.from_bytes(result[11:13], byteorder='little', signed=True) / 10  # Convert to actual decimal value
+                (sensor_type, sensor_missing_limit, _, _,
+                 sensor_broken_limit, resistance_25c, offset) = FLOOR_SENSOR_STRUCT.unpack_from(result)
+                offset /= 10  # Convert to actual decimal value
 
                 # Log all values in debug
                 _LOGGER.debug(
@@ -30,6 +30,9 @@ from . import EnstoConfigEntry
 
 _LOGGER = logging.getLogger(__name__)
 
+# Device clock drift that triggers a time mismatch notification
+_TIME_MISMATCH_LIMIT = timedelta(minutes=1)
+
 UNIT_MINUTES = "min"
 
 class EnstoBaseSensor(EnstoBaseEntity, SensorEntity):
@@ -54,7 +57,7 @@ class EnstoBaseSensor(EnstoBaseEntity, SensorEntity):
         self.async_on_remove(
             async_dispatcher_connect(
                 self.hass,
-                f"ensto_update_{self._manager.mac_address}",
+                self._manager.update_signal,
                 _update_immediately
             )
         )
@@ -246,7 +249,7 @@ class EnstoDateTimeSensor(EnstoBaseSensor):
             self.async_on_remove(
                 async_dispatcher_connect(
                     self.hass,
-                    f"ensto_update_{self._manager.mac_address}",
+                    self._manager.update_signal,
                     _update_immediately
                 )
             )
@@ -255,7 +258,7 @@ class EnstoDateTimeSensor(EnstoBaseSensor):
             self.async_on_remove(
                 async_dispatcher_connect(
                     self.hass,
-                    f"ensto_datetime_update_{self._manager.mac_address}",
+                    self._manager.datetime_update_signal,
                     _update_immediately
                 )
             )
@@ -288,7 +291,7 @@ class EnstoDateTimeSensor(EnstoBaseSensor):
                 time_diff = abs(ha_utc - device_utc)
                 
                 # Show notification if time difference is more than 1 minute
-                if time_diff > timedelta(minutes=1):
+                if time_diff > _TIME_MISMATCH_LIMIT:
                     if not self._alert_shown:
                         # Get device name for notification
                         device_name = self._manager.device_name or "Unknown Device"
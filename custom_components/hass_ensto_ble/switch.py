@@ -4,13 +4,12 @@ import logging
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers import device_registry as dr
 from homeassistant.util import dt as dt_util
 
 from datetime import datetime
 from .base_entity import EnstoBaseEntity
-from .const import SCAN_INTERVAL
+from .const import ONE_MINUTE, SCAN_INTERVAL
 
 from . import EnstoConfigEntry
 
@@ -163,7 +162,7 @@ class EnstoDaylightSavingSwitch(EnstoBaseEntity, SwitchEntity):
         # Create January datetime in UTC and convert to local timezone
         january_utc = datetime(2025, 1, 15, 12, 0, 0, tzinfo=dt_util.UTC)
         january_local = january_utc.astimezone(ha_tz)
-        tz_offset = int(january_local.utcoffset().total_seconds() / 60)
+        tz_offset = january_local.utcoffset() // ONE_MINUTE
         
         _LOGGER.debug("Action [Daylight Saving Enable] for [%s]: base timezone offset %d minutes", self._manager.mac_address, tz_offset)
 
@@ -186,7 +185,7 @@ class EnstoDaylightSavingSwitch(EnstoBaseEntity, SwitchEntity):
         
         # Convert current UTC time to local timezone to get current offset
         local_now = utc_now.astimezone(ha_tz)
-        tz_offset = int(local_now.utcoffset().total_seconds() / 60)
+        tz_offset = local_now.utcoffset() // ONE_MINUTE
         
         _LOGGER.debug("Action [Daylight Saving Disable] for [%s]: current timezone offset %d minutes", self._manager.mac_address, tz_offset)
 
@@ -253,10 +252,7 @@ class EnstoVacationModeSwitch(EnstoBaseEntity, SwitchEntity):
                 self._is_on = True
 
                 # Notify datetime entities to update
-                async_dispatcher_send(
-                    self.hass,
-                    f"ensto_datetime_update_{self._manager.mac_address}"
-                )
+                self._manager.schedule_datetime_update()
 
         except Exception as e:
             _LOGGER.error("Failed to enable vacation mode: %s", e)
@@ -276,10 +272,7 @@ class EnstoVacationModeSwitch(EnstoBaseEntity, SwitchEntity):
                 self._is_on = False
 
                 # Notify datetime entities to update
-                async_dispatcher_send(
-                    self.hass,
-                    f"ensto_datetime_update_{self._manager.mac_address}"
-                )
+                self._manager.schedule_datetime_update()
 
         except Exception as e:
             _LOGGER.error("Failed to disable vacation mode: %s", e)